@@ -0,0 +1,6 @@
+# Pipeline suite, its results are appended to bench_history.jsonl
+PYTHONPATH=src python3 bench/run.py "$@"
+# Per-feature benchmarks
+for bench in bench/bench_*.py; do
+    PYTHONPATH=src python3 "$bench"
+done
@@ -0,0 +1,50 @@
+import gc
+import tracemalloc
+from time import perf_counter
+from arena import NodeArena
+from corpus import CORPORA
+from markdown_to_html_node import markdown_to_html_node
+
+
+def retained_bytes(build, docs: list[str]):
+    # Memory still held once every document is converted, the markdown itself excluded
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    documents = [build(doc) for doc in docs]
+    gc.collect()
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return after - before, documents
+
+
+def best_time(func, repeat: int = 3):
+    best = float("inf")
+    for _ in range(repeat):
+        start = perf_counter()
+        func()
+        best = min(best, perf_counter() - start)
+    return best
+
+
+def main():
+    print(f"{'corpus':<16} {'trees (MB)':>11} {'arenas (MB)':>12} {'tree render (ms)':>17} {'arena render (ms)':>18}")
+    for name in ("link_heavy", "emphasis_heavy", "deep_list"):
+        # A site of 200 pages of 20 KB each
+        markdown = CORPORA[name](4_000_000)
+        blocks = markdown.split("\n\n")
+        step = max(1, len(blocks) // 200)
+        docs = ["\n\n".join(blocks[i:i + step]) for i in range(0, len(blocks), step)]
+        tree_bytes, trees = retained_bytes(markdown_to_html_node, docs)
+        arena_bytes, arenas = retained_bytes(lambda doc: NodeArena.from_html_node(markdown_to_html_node(doc)), docs)
+        assert [arena.to_html() for arena in arenas] == [tree.to_html() for tree in trees]
+        tree_seconds = best_time(lambda: [tree.to_html() for tree in trees])
+        arena_seconds = best_time(lambda: [arena.to_html() for arena in arenas])
+        print(
+            f"{name:<16} {tree_bytes / 1e6:>11.1f} {arena_bytes / 1e6:>12.1f}"
+            f" {tree_seconds * 1e3:>17.1f} {arena_seconds * 1e3:>18.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+import argparse
+import asyncio
+import time
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from unittest.mock import patch
+import asyncbuild
+import build as build_module
+from asyncbuild import build_async
+from build import build
+from corpus import emphasis_heavy
+from markdown_to_html_node import BLOCK_CACHE
+
+
+def slow(func, latency: float):
+    # Stands in for a network filesystem round trip on every read and write
+    def delayed(*args):
+        time.sleep(latency)
+        return func(*args)
+    return delayed
+
+
+def slow_convert_page(latency: float):
+    def convert_page(job):
+        time.sleep(2 * latency)
+        return original_convert_page(job)
+    return convert_page
+
+
+original_convert_page = build_module.convert_page
+
+
+def write_content(content_dir: Path, nb_pages: int, page_size: int):
+    # One corpus cut into pages, so pages do not share blocks through the block cache
+    blocks = emphasis_heavy(nb_pages * page_size).split("\n\n")
+    per_page = max(1, len(blocks) // nb_pages)
+    for i in range(nb_pages):
+        path = content_dir / f"section{i % 10}" / f"page{i}.md"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(f"# Page {i}\n\n" + "\n\n".join(blocks[i * per_page:(i + 1) * per_page]))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serial build against the asyncio build under simulated I/O latency")
+    parser.add_argument("--pages", type=int, default=400)
+    parser.add_argument("--page-size", type=int, default=8_000, help="bytes of markdown per page")
+    parser.add_argument("--workers", type=int, default=1)
+    args = parser.parse_args()
+    print(f"{'latency (ms)':>12} {'serial (s)':>11} {'async (s)':>10} {'overlap':>8}")
+    for latency in (0.0, 0.002, 0.01):
+        with TemporaryDirectory() as tmp:
+            content_dir = Path(tmp) / "content"
+            write_content(content_dir, args.pages, args.page_size)
+            BLOCK_CACHE.clear()
+            # The serial build reads each source twice: once to hash it, once to convert it
+            with patch("build.convert_page", slow_convert_page(latency)), \
+                    patch("build.hash_file", slow(build_module.hash_file, latency)):
+                start = perf_counter()
+                build(content_dir, Path(tmp) / "serial", workers=1)
+                serial_seconds = perf_counter() - start
+            BLOCK_CACHE.clear()
+            with patch("asyncbuild.read_source", slow(asyncbuild.read_source, latency)), \
+                    patch("asyncbuild.write_output", slow(asyncbuild.write_output, latency)):
+                start = perf_counter()
+                report = asyncio.run(build_async(content_dir, Path(tmp) / "async", workers=args.workers))
+                async_seconds = perf_counter() - start
+        print(f"{latency * 1e3:>12.0f} {serial_seconds:>11.2f} {async_seconds:>10.2f} {report.overlap_efficiency:>8.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+import random
+from time import perf_counter
+from blockcache import BlockCache
+from markdown_to_html_node import markdown_to_html_node, markdown_to_html_many
+
+
+FOOTERS = [
+    "_This preview is generated automatically._",
+    "Licensed under **CC BY 4.0**, see [license](https://example.com/license).",
+]
+
+
+def snippets(nb_docs: int):
+    rng = random.Random(0)
+    docs = []
+    for i in range(nb_docs):
+        docs.append(
+            f"## Snippet {i}\n\n"
+            f"Some **bold {rng.randrange(100)}** text with a [link](https://example.com/{i}).\n\n"
+            f"- first\n- second `code`\n\n"
+            f"{FOOTERS[i % len(FOOTERS)]}"
+        )
+    return docs
+
+
+def timed(convert):
+    start = perf_counter()
+    results = convert()
+    return perf_counter() - start, results
+
+
+def main():
+    docs = snippets(20_000)
+    reference_seconds, reference = timed(lambda: [markdown_to_html_node(doc).to_html() for doc in docs])
+    variants = {
+        "batch, serial": lambda: markdown_to_html_many(docs, BlockCache()),
+        "batch, threads": lambda: markdown_to_html_many(docs, BlockCache(), executor="thread", workers=4),
+        "batch, processes": lambda: markdown_to_html_many(docs, executor="process", chunksize=256),
+    }
+    print(f"{'converter':<20} {'seconds':>9} {'docs/s':>9} {'speedup':>8}")
+    print(f"{'per-document loop':<20} {reference_seconds:>9.3f} {len(docs) / reference_seconds:>9.0f} {1:>8.2f}")
+    for name, convert in variants.items():
+        seconds, results = timed(convert)
+        assert results == reference
+        print(f"{name:<20} {seconds:>9.3f} {len(docs) / seconds:>9.0f} {reference_seconds / seconds:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+import tracemalloc
+from tempfile import TemporaryDirectory
+from pathlib import Path
+from textnode import markdown_to_blocks, iter_blocks
+
+
+BLOCKS = [
+    "# Release notes",
+    "Some **bold** paragraph with a [link](https://example.com)\nspread over two lines",
+    "```\ndef f():\n\n    return 1\n```",
+    "- item 1\n- item 2\n- item 3",
+]
+
+
+def write_document(path: Path, nb_blocks: int):
+    with open(path, "w") as file:
+        for i in range(nb_blocks):
+            file.write(BLOCKS[i % len(BLOCKS)])
+            file.write("\n\n")
+
+
+def peak_bytes(convert, path: Path):
+    tracemalloc.start()
+    nb_blocks = convert(path)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return nb_blocks, peak
+
+
+def read_and_split(path: Path):
+    with open(path) as file:
+        return len(markdown_to_blocks(file.read()))
+
+
+def stream(path: Path):
+    with open(path) as file:
+        return sum(1 for _ in iter_blocks(file))
+
+
+def main():
+    print(f"{'blocks':>8} {'file (KB)':>10} {'split peak (KB)':>16} {'stream peak (KB)':>17}")
+    with TemporaryDirectory() as tmp:
+        for nb_blocks in (10_000, 40_000, 160_000):
+            path = Path(tmp) / "doc.md"
+            write_document(path, nb_blocks)
+            split_blocks, split_peak = peak_bytes(read_and_split, path)
+            stream_blocks, stream_peak = peak_bytes(stream, path)
+            assert split_blocks == stream_blocks == nb_blocks
+            print(
+                f"{nb_blocks:>8} {path.stat().st_size / 1024:>10.0f}"
+                f" {split_peak / 1024:>16.0f} {stream_peak / 1024:>17.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+from time import perf_counter
+from markdown_to_html_node import markdown_to_html_node
+
+
+SECTION = """# Section {i}
+
+This is a **bold** paragraph with _italic_ text, `inline code` and a [link](https://example.com/{i})
+that wraps onto a second line with an ![image](https://example.com/{i}.png).
+
+> A quote with **emphasis**
+> spread over two lines
+
+- first item
+- second item with [a link](https://example.com/item/{i})
+- third item
+
+1. one
+2. two
+3. three
+
+```
+def section_{i}():
+
+    return {i}
+```
+"""
+
+
+def document(nb_sections: int):
+    return "\n".join(SECTION.format(i=i) for i in range(nb_sections))
+
+
+def main():
+    print(f"{'sections':>9} {'size (MB)':>10} {'seconds':>9} {'MB/s':>7}")
+    for nb_sections in (100, 1_000, 10_000):
+        markdown = document(nb_sections)
+        size = len(markdown.encode()) / 1e6
+        start = perf_counter()
+        markdown_to_html_node(markdown).to_html()
+        seconds = perf_counter() - start
+        print(f"{nb_sections:>9} {size:>10.2f} {seconds:>9.3f} {size / seconds:>7.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+import html
+from time import perf_counter
+from unittest.mock import patch
+import htmlnode
+from htmlnode import LeafNode, ParentNode
+
+
+def unescaped_props(props: dict):
+    # Serialization before escaping existed: the floor to measure against
+    return " " + " ".join([f'{key}="{props[key]}"' for key in props])
+
+
+def naive_escaped_props(props: dict):
+    return " " + " ".join([f'{key}="{html.escape(str(props[key]))}"' for key in props])
+
+
+def naive_escape_text(text: str):
+    return html.escape(text, quote=False)
+
+
+VARIANTS = {
+    "unescaped": (lambda text: text, unescaped_props),
+    "html.escape": (naive_escape_text, naive_escaped_props),
+    "fast path": (htmlnode.escape_text, htmlnode.serialize_props),
+}
+
+
+def page(nb_nodes: int, special: bool):
+    text = "a < b & c > d" if special else "plain words with nothing to escape"
+    children = []
+    for i in range(nb_nodes):
+        if i % 4 == 0:
+            children.append(LeafNode("a", text, {"href": f"https://example.com/docs/{i % 100}"}))
+        else:
+            children.append(LeafNode("span", text))
+    return ParentNode("div", children)
+
+
+def best_time(node: ParentNode, repeat: int = 5):
+    best = float("inf")
+    for _ in range(repeat):
+        start = perf_counter()
+        node.to_html()
+        best = min(best, perf_counter() - start)
+    return best
+
+
+def main():
+    print(f"{'text':<10}" + "".join(f" {name + ' (ms)':>18}" for name in VARIANTS))
+    for special in (False, True):
+        node = page(200_000, special)
+        timings = []
+        for escape_text, serialize_props in VARIANTS.values():
+            with patch("htmlnode.escape_text", escape_text), patch("htmlnode.serialize_props", serialize_props):
+                timings.append(best_time(node))
+        label = "special" if special else "plain"
+        print(f"{label:<10}" + "".join(f" {seconds * 1e3:>18.1f}" for seconds in timings))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+import re
+from time import perf_counter
+from textnode import TextNode, TextType, split_nodes_link
+
+
+def legacy_split_nodes_link(old_nodes: list[TextNode]):
+    # str.split based implementation kept as the reference to beat
+    new_nodes: list[TextNode] = []
+    for node in old_nodes:
+        if node.text_type != TextType.TEXT:
+            new_nodes.append(node)
+            continue
+        matches = re.findall(r"\[(?P<text>.*?)\]\((?P<url>.*?)\)", node.text)
+        if not matches:
+            new_nodes.append(node)
+            continue
+        text_left = node.text
+        for match_text, match_url in matches:
+            parts = text_left.split(f"[{match_text}]({match_url})", 1)
+            if parts[0] != "":
+                new_nodes.append(TextNode(parts[0], TextType.TEXT))
+            text_left = parts[1]
+            new_nodes.append(TextNode(match_text, TextType.LINK, match_url))
+        if text_left:
+            new_nodes.append(TextNode(text_left, TextType.TEXT))
+    return new_nodes
+
+
+def link_paragraph(nb_links: int):
+    return " ".join(f"see [page {i}](https://example.com/docs/{i})" for i in range(nb_links))
+
+
+def time_split(split, nodes: list[TextNode], repeat: int = 3):
+    best = float("inf")
+    for _ in range(repeat):
+        start = perf_counter()
+        split(nodes)
+        best = min(best, perf_counter() - start)
+    return best
+
+
+def main():
+    print(f"{'links':>8} {'spans (ms)':>12} {'legacy (ms)':>12} {'spans us/link':>14} {'legacy us/link':>15}")
+    for nb_links in (1_000, 2_000, 4_000, 8_000, 16_000):
+        nodes = [TextNode(link_paragraph(nb_links), TextType.TEXT)]
+        assert split_nodes_link(nodes) == legacy_split_nodes_link(nodes)
+        spans = time_split(split_nodes_link, nodes)
+        legacy = time_split(legacy_split_nodes_link, nodes)
+        print(
+            f"{nb_links:>8} {spans * 1e3:>12.2f} {legacy * 1e3:>12.2f}"
+            f" {spans * 1e6 / nb_links:>14.2f} {legacy * 1e6 / nb_links:>15.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
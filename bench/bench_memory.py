@@ -0,0 +1,47 @@
+import tracemalloc
+from textnode import TextNode, TextType
+from htmlnode import LeafNode, ParentNode
+
+
+class DictTextNode():
+    # Per-instance __dict__ layout, kept as the reference to beat
+    def __init__(self, text: str, text_type: TextType, url: str | None = None):
+        self.text = text
+        self.text_type = text_type
+        self.url = url
+
+
+class DictHTMLNode():
+    def __init__(self, tag, value, children, props):
+        self.tag = tag
+        self.value = value
+        self.children = children
+        self.props = props
+
+
+def bytes_per_node(factory, nb_nodes: int = 200_000):
+    # Strings are created up front so only the node objects are measured
+    values = [f"value {i}" for i in range(nb_nodes)]
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    nodes = [factory(value) for value in values]
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    # Discount the list holding the nodes
+    return (after - before - nodes.__sizeof__()) / nb_nodes
+
+
+def main():
+    leaf = LeafNode(None, "child")
+    cases = [
+        ("TextNode", lambda v: DictTextNode(v, TextType.TEXT), lambda v: TextNode(v, TextType.TEXT)),
+        ("LeafNode", lambda v: DictHTMLNode("b", v, None, None), lambda v: LeafNode("b", v)),
+        ("ParentNode", lambda v: DictHTMLNode("p", None, [leaf], None), lambda v: ParentNode("p", [leaf])),
+    ]
+    print(f"{'node':<12} {'__dict__ (B)':>13} {'__slots__ (B)':>14}")
+    for name, dict_factory, slots_factory in cases:
+        print(f"{name:<12} {bytes_per_node(dict_factory):>13.0f} {bytes_per_node(slots_factory):>14.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+import argparse
+import os
+import resource
+import subprocess
+import sys
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from corpus import emphasis_heavy, long_code
+from mappedfile import mapped_markdown_to_html
+from markdown_to_html_node import markdown_to_html
+
+
+def write_corpus(path: Path, size: int):
+    # Written in slices so generating the input does not need it in memory either
+    slice_size = 16 << 20
+    with open(path, "w", encoding="utf-8") as file:
+        written = 0
+        while written < size:
+            chunk = emphasis_heavy(slice_size // 2) + "\n\n" + long_code(slice_size // 2) + "\n\n"
+            written += file.write(chunk)
+
+
+def convert_read(path: Path, output: Path):
+    with open(path, encoding="utf-8") as file:
+        markdown = file.read()
+    html = markdown_to_html(markdown)
+    with open(output, "w", encoding="utf-8") as file:
+        file.write(html)
+
+
+def convert_mmap(path: Path, output: Path):
+    with open(output, "w", encoding="utf-8") as file:
+        mapped_markdown_to_html(path, file)
+
+
+MODES = {"read": convert_read, "mmap": convert_mmap}
+
+
+def run_child(mode: str, path: Path, output: Path):
+    start = perf_counter()
+    MODES[mode](path, output)
+    seconds = perf_counter() - start
+    # ru_maxrss is in KiB on Linux
+    print(seconds, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Peak RSS of whole-file reads against memory-mapped input")
+    # The read mode peaks at several times the corpus size: fits in a few hundred MB by default.
+    # The 1 GB comparison is opt-in, on a machine with enough RAM:
+    #   PYTHONPATH=src python3 bench/bench_mmap.py --size 1000000000
+    parser.add_argument("--size", type=int, default=100_000_000, help="bytes of markdown")
+    parser.add_argument("--child", nargs=3, metavar=("MODE", "SOURCE", "OUTPUT"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        mode, source, output = args.child
+        run_child(mode, Path(source), Path(output))
+        return
+    with TemporaryDirectory() as tmp:
+        source, output = Path(tmp) / "reference.md", Path(tmp) / "reference.html"
+        write_corpus(source, args.size)
+        print(f"{os.path.getsize(source) / 1e6:.0f} MB of markdown")
+        print(f"{'mode':<6} {'seconds':>9} {'peak RSS (MB)':>14}")
+        for mode in MODES:
+            # A fresh interpreter per mode so each peak is measured on its own
+            result = subprocess.run(
+                [sys.executable, __file__, "--child", mode, str(source), str(output)],
+                capture_output=True, text=True, check=True, env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+            )
+            seconds, peak = result.stdout.split()
+            print(f"{mode:<6} {float(seconds):>9.2f} {int(peak) / 1e6:>14.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+import argparse
+import os
+import pickle
+from time import perf_counter
+from corpus import CORPORA
+from markdown_to_html_node import markdown_block_to_html_node, markdown_to_html_parallel, render_blocks
+from textnode import markdown_to_blocks
+
+
+def transfer_sizes(markdown: str, chunk_bytes: int):
+    # What one chunk costs to send back: its HTML string against its node trees
+    blocks = []
+    size = 0
+    for block in markdown_to_blocks(markdown):
+        blocks.append(block)
+        size += len(block)
+        if size >= chunk_bytes:
+            break
+    fragment = pickle.dumps(render_blocks(blocks))
+    nodes = pickle.dumps([markdown_block_to_html_node(block) for block in blocks])
+    return len(fragment), len(nodes)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Scaling of one-document conversion over worker processes")
+    parser.add_argument("--size", type=int, default=50_000_000, help="bytes of markdown")
+    parser.add_argument("--corpus", choices=sorted(CORPORA), default="emphasis_heavy")
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunk-bytes", type=int, default=256 << 10)
+    args = parser.parse_args()
+    markdown = CORPORA[args.corpus](args.size)
+    fragment_size, nodes_size = transfer_sizes(markdown, args.chunk_bytes)
+    print(f"one chunk pickled: {fragment_size / 1e3:.0f} KB of HTML, {nodes_size / 1e3:.0f} KB of HTMLNode trees")
+    print(f"{'workers':>7} {'seconds':>9} {'MB/s':>8} {'speedup':>8}")
+    reference = None
+    serial_seconds = 0.0
+    for workers in range(1, args.max_workers + 1):
+        start = perf_counter()
+        html = markdown_to_html_parallel(markdown, workers, args.chunk_bytes)
+        seconds = perf_counter() - start
+        if reference is None:
+            reference, serial_seconds = html, seconds
+        assert html == reference
+        print(f"{workers:>7} {seconds:>9.2f} {len(markdown) / 1e6 / seconds:>8.2f} {serial_seconds / seconds:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
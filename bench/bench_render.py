@@ -0,0 +1,55 @@
+from time import perf_counter
+from htmlnode import HTMLNode, LeafNode, ParentNode
+
+
+def recursive_to_html(node: HTMLNode) -> str:
+    # Recursive renderer with per-level child validation, kept as the reference to beat
+    if isinstance(node, LeafNode):
+        return node.to_html()
+    if not node.tag:
+        raise ValueError("Parent node must have a tag")
+    if not node.children:
+        raise ValueError("Parent node must have children")
+    if not all(isinstance(child, HTMLNode) for child in node.children):
+        raise TypeError("All children must be instances of HTMLNode")
+    result = f"<{node.tag}{node.props_to_html()}>"
+    for child in node.children:
+        result += recursive_to_html(child)
+    result += f"</{node.tag}>"
+    return result
+
+
+def deep_tree(depth: int):
+    node: HTMLNode = LeafNode(None, "deep")
+    for _ in range(depth):
+        node = ParentNode("blockquote", [node])
+    return node
+
+
+def wide_tree(width: int):
+    return ParentNode("ul", [LeafNode("li", f"item {i}") for i in range(width)])
+
+
+def time_render(render, node: HTMLNode):
+    start = perf_counter()
+    try:
+        html = render(node)
+    except RecursionError:
+        return "RecursionError", 0
+    return f"{(perf_counter() - start) * 1e3:.1f}", len(html)
+
+
+def main():
+    print(f"{'tree':<22} {'iterative (ms)':>15} {'recursive (ms)':>15} {'html (MB)':>10}")
+    for name, node in (
+        ("deep 500", deep_tree(500)),
+        ("deep 10k", deep_tree(10_000)),
+        ("wide 1M", wide_tree(1_000_000)),
+    ):
+        iterative, size = time_render(lambda node: node.to_html(), node)
+        recursive, _ = time_render(recursive_to_html, node)
+        print(f"{name:<22} {iterative:>15} {recursive:>15} {size / 1e6:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+import pickle
+from time import perf_counter
+from corpus import CORPORA
+from markdown_to_html_node import markdown_to_html_node
+from textnode import markdown_to_blocks, text_to_textnodes
+import wireformat
+
+
+FORMATS = {
+    "pickle": (lambda obj: pickle.dumps(obj, pickle.HIGHEST_PROTOCOL), pickle.loads),
+    "wireformat": (wireformat.dumps, wireformat.loads),
+}
+
+
+def best_time(func, repeat: int = 5):
+    best = float("inf")
+    for _ in range(repeat):
+        start = perf_counter()
+        func()
+        best = min(best, perf_counter() - start)
+    return best
+
+
+def trees(size: int):
+    cases = {}
+    for name in ("link_heavy", "emphasis_heavy", "deep_list"):
+        markdown = CORPORA[name](size)
+        cases[f"{name} html"] = markdown_to_html_node(markdown)
+        cases[f"{name} text"] = [node for block in markdown_to_blocks(markdown) for node in text_to_textnodes(block)]
+    return cases
+
+
+def main():
+    print(f"{'tree':<22} {'format':<11} {'KB':>9} {'dumps (ms)':>11} {'loads (ms)':>11}")
+    for name, tree in trees(1_000_000).items():
+        for format_name, (dumps, loads) in FORMATS.items():
+            data = dumps(tree)
+            assert loads(data) == tree
+            print(
+                f"{name:<22} {format_name:<11} {len(data) / 1e3:>9.0f}"
+                f" {best_time(lambda: dumps(tree)) * 1e3:>11.1f} {best_time(lambda: loads(data)) * 1e3:>11.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
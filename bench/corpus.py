@@ -0,0 +1,76 @@
+import random
+
+
+def repeat_blocks(make_block, size: int, seed: int = 0):
+    rng = random.Random(seed)
+    blocks: list[str] = []
+    total = 0
+    i = 0
+    while total < size:
+        block = make_block(i, rng)
+        blocks.append(block)
+        total += len(block) + 2
+        i += 1
+    return "\n\n".join(blocks)
+
+
+def link_heavy(size: int):
+    def make_block(i: int, rng: random.Random):
+        links = " and ".join(
+            f"[page {i}-{j}](https://example.com/docs/{rng.randrange(10_000)})" for j in range(20)
+        )
+        return f"See {links}, or the ![diagram {i}](https://example.com/img/{i}.png)."
+    return repeat_blocks(make_block, size)
+
+
+def emphasis_heavy(size: int):
+    def make_block(i: int, rng: random.Random):
+        words = []
+        for j in range(60):
+            word = f"word{rng.randrange(1000)}"
+            style = j % 4
+            if style == 1:
+                word = f"**{word}**"
+            elif style == 2:
+                word = f"_{word}_"
+            elif style == 3:
+                word = f"`{word}`"
+            words.append(word)
+        return " ".join(words)
+    return repeat_blocks(make_block, size)
+
+
+def long_code(size: int):
+    def make_block(i: int, rng: random.Random):
+        body = "\n".join(f"    value_{j} = compute({rng.randrange(100)}) # **not bold**" for j in range(200))
+        return f"Listing {i}:\n\n```\ndef listing_{i}():\n\n{body}\n```"
+    return repeat_blocks(make_block, size)
+
+
+def deep_list(size: int):
+    # Lists are flat in this markdown dialect: "deep" means thousands of items per list
+    def make_block(i: int, rng: random.Random):
+        if i % 2:
+            return "\n".join(f"{j}. step _{j}_ of list {i}" for j in range(1, 2001))
+        return "\n".join(f"- item **{j}** with [link](https://example.com/{j})" for j in range(2000))
+    return repeat_blocks(make_block, size)
+
+
+def huge_paragraph(size: int):
+    rng = random.Random(0)
+    sentences: list[str] = []
+    total = 0
+    while total < size:
+        sentence = f"Sentence {len(sentences)} has **bold {rng.randrange(100)}** and a [link](https://example.com/{rng.randrange(100)})."
+        sentences.append(sentence)
+        total += len(sentence) + 1
+    return " ".join(sentences)
+
+
+CORPORA = {
+    "link_heavy": link_heavy,
+    "emphasis_heavy": emphasis_heavy,
+    "long_code": long_code,
+    "deep_list": deep_list,
+    "huge_paragraph": huge_paragraph,
+}
@@ -0,0 +1,138 @@
+import argparse
+import json
+import platform
+import subprocess
+from datetime import datetime, timezone
+from pathlib import Path
+from time import perf_counter
+from corpus import CORPORA
+from textnode import markdown_to_blocks, text_to_textnodes
+from textblock import BlockType, block_to_block_type
+from markdown_to_html_node import markdown_to_html_node
+
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+
+
+def best_time(func, repeat: int):
+    best = float("inf")
+    for _ in range(repeat):
+        start = perf_counter()
+        func()
+        best = min(best, perf_counter() - start)
+    return best
+
+
+def inline_texts(blocks: list[str]):
+    texts: list[str] = []
+    for block in blocks:
+        block_type = block_to_block_type(block)
+        if block_type in (BlockType.PARAGRAPH, BlockType.HEADING, BlockType.QUOTE):
+            texts.append(block)
+        elif block_type in (BlockType.UNORDERED_LIST, BlockType.ORDERED_LIST):
+            texts.extend(line.split(" ", 1)[1] for line in block.split("\n"))
+    return texts
+
+
+def bench_corpus(markdown: str, repeat: int):
+    blocks = markdown_to_blocks(markdown)
+    texts = inline_texts(blocks)
+    node = markdown_to_html_node(markdown)
+    stages = {
+        "markdown_to_blocks": lambda: markdown_to_blocks(markdown),
+        "block_to_block_type": lambda: [block_to_block_type(block) for block in blocks],
+        "text_to_textnodes": lambda: [text_to_textnodes(text) for text in texts],
+        # Opt-in single-pass engine, measured next to the default pipeline
+        "tokenize_inline": lambda: [text_to_textnodes(text, engine="single_pass") for text in texts],
+        "to_html": node.to_html,
+        "full_page": lambda: markdown_to_html_node(markdown).to_html(),
+    }
+    return {stage: best_time(func, repeat) for stage, func in stages.items()}
+
+
+def git_commit():
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=ROOT_DIR, capture_output=True, text=True, check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.strip()
+
+
+def load_history(path: Path):
+    if not path.exists():
+        return []
+    with open(path, encoding="utf-8") as file:
+        return [json.loads(line) for line in file if line.strip()]
+
+
+def append_history(path: Path, report: dict):
+    with open(path, "a", encoding="utf-8") as file:
+        file.write(json.dumps(report) + "\n")
+
+
+def previous_seconds(history: list[dict], size: int):
+    # Latest earlier run on the same corpus size, so timings are comparable
+    for report in reversed(history):
+        if report["size"] == size:
+            return {(result["corpus"], result["stage"]): result["seconds"] for result in report["results"]}
+    return {}
+
+
+def format_results(results: list[dict], previous: dict[tuple[str, str], float]):
+    lines = [f"{'corpus':<16} {'stage':<20} {'ms':>10} {'MB/s':>8} {'vs prev':>8}"]
+    for result in results:
+        before = previous.get((result["corpus"], result["stage"]))
+        change = f"{result['seconds'] / before - 1:+.0%}" if before else "-"
+        lines.append(
+            f"{result['corpus']:<16} {result['stage']:<20}"
+            f" {result['seconds'] * 1e3:>10.2f} {result['mb_per_s']:>8.2f} {change:>8}"
+        )
+    return "\n".join(lines)
+
+
+def parse_args(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description="Parser, renderer and end-to-end benchmarks")
+    parser.add_argument("--size", type=int, default=1_000_000, help="bytes of markdown per corpus")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per stage, the best one is kept")
+    parser.add_argument("--corpus", choices=sorted(CORPORA), action="append", help="only run these corpora")
+    parser.add_argument("--output", type=Path, default=ROOT_DIR / "bench_output.txt", help="text report")
+    parser.add_argument(
+        "--history", type=Path, default=ROOT_DIR / "bench_history.jsonl",
+        help="one JSON record per run is appended here, tracked to compare commits",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None):
+    args = parse_args(argv)
+    results = []
+    for name in args.corpus or CORPORA:
+        markdown = CORPORA[name](args.size)
+        size = len(markdown.encode()) / 1e6
+        for stage, seconds in bench_corpus(markdown, args.repeat).items():
+            results.append({
+                "corpus": name,
+                "stage": stage,
+                "bytes": int(size * 1e6),
+                "seconds": seconds,
+                "mb_per_s": size / seconds if seconds else 0.0,
+            })
+    report = {
+        "commit": git_commit(),
+        "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "size": args.size,
+        "repeat": args.repeat,
+        "results": results,
+    }
+    table = format_results(results, previous_seconds(load_history(args.history), args.size))
+    print(table)
+    args.output.write_text(f"commit {report['commit']} on {report['date']}, Python {report['python']}\n{table}\n")
+    append_history(args.history, report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+from array import array
+from typing import Iterator, TextIO
+from htmlnode import HTMLNode, LeafNode, ParentNode, escape_text, serialize_props
+
+
+LEAF = 0
+PARENT = 1
+
+
+class NodeArena():
+    # One document as parallel arrays, nodes in pre-order (a parent comes before its children).
+    # Node i is a tag id, a kind, a parent index (-1 at the root), a props id and the
+    # slice values[value_offsets[i]:value_offsets[i + 1]] of the shared value buffer.
+    __slots__ = ("tags", "props", "tag_ids", "kinds", "parents", "props_ids", "value_offsets", "values")
+
+    def __init__(self) -> None:
+        self.tags: list[str | None] = [None]
+        self.props: list[dict | None] = [None]
+        self.tag_ids = array("I")
+        self.kinds = array("B")
+        self.parents = array("i")
+        self.props_ids = array("I")
+        self.value_offsets = array("I", [0])
+        self.values = ""
+
+    @classmethod
+    def from_html_node(cls, root: HTMLNode):
+        arena = cls()
+        tag_index: dict[str | None, int] = {None: 0}
+        props_index: dict[tuple, int] = {}
+        values: list[str] = []
+        offset = 0
+        stack: list[tuple[HTMLNode, int]] = [(root, -1)]
+        while stack:
+            node, parent = stack.pop()
+            index = len(arena.kinds)
+            tag_id = tag_index.get(node.tag)
+            if tag_id is None:
+                tag_id = tag_index[node.tag] = len(arena.tags)
+                arena.tags.append(node.tag)
+            props_id = 0
+            if node.props:
+                items = tuple(node.props.items())
+                props_id = props_index.get(items, 0)
+                if not props_id:
+                    props_id = props_index[items] = len(arena.props)
+                    arena.props.append(node.props)
+            if isinstance(node, LeafNode):
+                arena.kinds.append(LEAF)
+                values.append(node.value)
+                offset += len(node.value)
+            elif isinstance(node, ParentNode):
+                arena.kinds.append(PARENT)
+                stack.extend((child, index) for child in reversed(node.children or []))
+            else:
+                raise TypeError(f"Cannot store {type(node).__name__} in an arena")
+            arena.tag_ids.append(tag_id)
+            arena.parents.append(parent)
+            arena.props_ids.append(props_id)
+            arena.value_offsets.append(offset)
+        arena.values = "".join(values)
+        return arena
+
+    def __len__(self):
+        return len(self.kinds)
+
+    def value(self, index: int):
+        return self.values[self.value_offsets[index]:self.value_offsets[index + 1]]
+
+    def to_html_node(self):
+        nodes: list[HTMLNode] = []
+        for index in range(len(self.kinds)):
+            tag, props = self.tags[self.tag_ids[index]], self.props[self.props_ids[index]]
+            if self.kinds[index] == LEAF:
+                node = LeafNode(tag, self.value(index), props)
+            else:
+                node = ParentNode(tag, [], props)
+            nodes.append(node)
+            parent = self.parents[index]
+            if parent >= 0:
+                nodes[parent].children.append(node)
+        return nodes[0]
+
+    def iter_html(self) -> Iterator[str]:
+        # The open parents form a stack: a node whose parent is not on top closes the ones above it
+        tags, props, values = self.tags, self.props, self.values
+        # Plain lists index faster than arrays, which box every item they return
+        tag_ids, kinds, parents = self.tag_ids.tolist(), self.kinds.tolist(), self.parents.tolist()
+        props_ids, offsets = self.props_ids.tolist(), self.value_offsets.tolist()
+        size = len(kinds)
+        # Opening tags by tag id and props id: few distinct pairs per document
+        openers: dict[int, str] = {}
+        open_parents: list[int] = []
+        for index in range(size):
+            parent = parents[index]
+            while open_parents and open_parents[-1] != parent:
+                yield f"</{tags[tag_ids[open_parents.pop()]]}>"
+            tag_id = tag_ids[index]
+            tag = tags[tag_id]
+            kind = kinds[index]
+            if tag is None and kind == LEAF:
+                yield escape_text(values[offsets[index]:offsets[index + 1]])
+                continue
+            props_id = props_ids[index]
+            key = tag_id << 32 | props_id
+            opener = openers.get(key)
+            if opener is None:
+                node_props = props[props_id]
+                opener = openers[key] = f"<{tag}{serialize_props(node_props) if node_props else ''}>"
+            if kind == PARENT:
+                if not tag:
+                    raise ValueError("Parent node must have a tag")
+                if index + 1 == size or parents[index + 1] != index:
+                    raise ValueError("Parent node must have children")
+                open_parents.append(index)
+                yield opener
+                continue
+            yield f"{opener}{escape_text(values[offsets[index]:offsets[index + 1]])}</{tag}>"
+        while open_parents:
+            yield f"</{tags[tag_ids[open_parents.pop()]]}>"
+
+    def to_html(self):
+        return "".join(self.iter_html())
+
+    def validate(self):
+        # The errors iter_html raises, checked before anything is written
+        tags, tag_ids, kinds, parents = self.tags, self.tag_ids, self.kinds, self.parents
+        size = len(kinds)
+        for index in range(size):
+            if kinds[index] != PARENT:
+                continue
+            if not tags[tag_ids[index]]:
+                raise ValueError("Parent node must have a tag")
+            if index + 1 == size or parents[index + 1] != index:
+                raise ValueError("Parent node must have children")
+
+    def write_html(self, stream: TextIO):
+        self.validate()
+        write = stream.write
+        for chunk in self.iter_html():
+            write(chunk)
+
+    def iter_props(self, name: str):
+        # Attribute values without building nodes, e.g. every href for link checking
+        props_ids, props = self.props_ids, self.props
+        for index in range(len(props_ids)):
+            node_props = props[props_ids[index]]
+            if node_props and name in node_props:
+                yield node_props[name]
+
+    def __repr__(self) -> str:
+        return f"NodeArena(nodes={len(self)}, tags={len(self.tags) - 1}, props={len(self.props) - 1})"
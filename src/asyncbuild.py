@@ -0,0 +1,234 @@
+import asyncio
+import hashlib
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from time import perf_counter, thread_time
+from typing import Callable
+import build as build_module
+from build import (
+    MANIFEST_NAME,
+    BuildReport,
+    convert_page,
+    find_pages,
+    hash_file,
+    init_render_cache,
+    load_manifest,
+    manifest_entry,
+    pipeline_version,
+    remove_stale_outputs,
+    render_cached_page,
+    save_manifest,
+)
+
+
+def read_source(source: str, destination: str):
+    exists = os.path.exists(destination)
+    if os.path.getsize(source) >= build_module.MMAP_THRESHOLD:
+        # Left to convert_page, which maps the file instead of reading it whole
+        return None, hash_file(source), exists
+    # Hashed for the manifest from the same bytes that get converted: each source is read once
+    with open(source, "rb") as file:
+        data = file.read()
+    markdown = data.decode("utf-8")
+    if "\r" in markdown:
+        # Same newlines as a text-mode read in build.convert_page
+        markdown = markdown.replace("\r\n", "\n").replace("\r", "\n")
+    return markdown, hashlib.sha256(data).hexdigest(), exists
+
+
+def write_output(destination: str, html: str):
+    os.makedirs(os.path.dirname(destination), exist_ok=True)
+    with open(destination, "w", encoding="utf-8") as file:
+        file.write(html)
+
+
+def timed_render(markdown: str, source: str):
+    # CPU time of the worker thread, so waiting on the cache or the GIL is not counted as busy
+    start = thread_time()
+    try:
+        html = render_cached_page(markdown, Path(source).stem)
+    except ValueError as error:
+        raise ValueError(f"{source}: {error}") from error
+    return html, thread_time() - start
+
+
+def timed_convert_page(source: str, destination: str):
+    start = thread_time()
+    convert_page((source, destination))
+    return thread_time() - start
+
+
+class AsyncBuildReport(BuildReport):
+    def __init__(
+            self,
+            built: list[str],
+            skipped: list[str],
+            removed: list[str],
+            workers: int,
+            wall_seconds: float,
+            cpu_seconds: float,
+            read_seconds: float,
+            write_seconds: float,
+            plan_seconds: float = 0.0,
+            ) -> None:
+        super().__init__(built, skipped, removed)
+        self.workers = workers
+        # Wall time of the read/convert/write pipeline, plan_seconds is the content scan before it
+        self.wall_seconds = wall_seconds
+        self.plan_seconds = plan_seconds
+        self.cpu_seconds = cpu_seconds
+        self.read_seconds = read_seconds
+        self.write_seconds = write_seconds
+
+    @property
+    def overlap_efficiency(self):
+        # 1.0 means the conversion workers never waited on reads or writes
+        if not self.wall_seconds:
+            return 0.0
+        return self.cpu_seconds / (self.wall_seconds * self.workers)
+
+    def __repr__(self) -> str:
+        return (
+            f"AsyncBuildReport(built={len(self.built)}, skipped={len(self.skipped)}, removed={len(self.removed)},"
+            f" wall={self.wall_seconds:.3f}s, cpu={self.cpu_seconds:.3f}s, overlap={self.overlap_efficiency:.0%})"
+        )
+
+
+def cpu_executor(workers: int, cache_args: tuple) -> Executor:
+    if workers == 1:
+        # A single thread keeps the SQLite connection on the thread that opened it
+        return ThreadPoolExecutor(max_workers=1, initializer=init_render_cache, initargs=cache_args)
+    return ProcessPoolExecutor(max_workers=workers, initializer=init_render_cache, initargs=cache_args)
+
+
+def first_error(group: BaseExceptionGroup) -> BaseException:
+    error = group.exceptions[0]
+    while isinstance(error, BaseExceptionGroup):
+        error = error.exceptions[0]
+    return error
+
+
+async def convert_pages_async(
+        pages: list[tuple[str, str]],
+        workers: int,
+        io_workers: int,
+        queue_size: int,
+        cache_args: tuple,
+        select: Callable[[str, str, str, bool], bool] = lambda *page: True,
+        ):
+    # select(source, destination, digest, output_exists) decides, once a page is read, if it is converted
+    loop = asyncio.get_running_loop()
+    pending = iter(pages)
+    sources: asyncio.Queue = asyncio.Queue(queue_size)
+    rendered: asyncio.Queue = asyncio.Queue(queue_size)
+    totals = {"cpu": 0.0, "read": 0.0, "write": 0.0}
+    # Two pages in flight per worker so a worker never idles between results
+    nb_converters = workers * 2
+
+    async def read(io_pool: Executor):
+        for source, destination in pending:
+            start = perf_counter()
+            markdown, digest, exists = await loop.run_in_executor(io_pool, read_source, source, destination)
+            totals["read"] += perf_counter() - start
+            if select(source, destination, digest, exists):
+                await sources.put((markdown, source, destination))
+
+    async def convert(pool: Executor):
+        while (item := await sources.get()) is not None:
+            markdown, source, destination = item
+            if markdown is None:
+                totals["cpu"] += await loop.run_in_executor(pool, timed_convert_page, source, destination)
+                continue
+            html, seconds = await loop.run_in_executor(pool, timed_render, markdown, source)
+            totals["cpu"] += seconds
+            await rendered.put((destination, html))
+
+    async def write(io_pool: Executor):
+        while (item := await rendered.get()) is not None:
+            start = perf_counter()
+            await loop.run_in_executor(io_pool, write_output, *item)
+            totals["write"] += perf_counter() - start
+
+    async def read_all(io_pool: Executor):
+        async with asyncio.TaskGroup() as readers:
+            for _ in range(io_workers):
+                readers.create_task(read(io_pool))
+        for _ in range(nb_converters):
+            await sources.put(None)
+
+    async def convert_all(pool: Executor):
+        async with asyncio.TaskGroup() as converters:
+            for _ in range(nb_converters):
+                converters.create_task(convert(pool))
+        for _ in range(io_workers):
+            await rendered.put(None)
+
+    async def write_all(io_pool: Executor):
+        async with asyncio.TaskGroup() as writers:
+            for _ in range(io_workers):
+                writers.create_task(write(io_pool))
+
+    pool = cpu_executor(workers, cache_args)
+    try:
+        with ThreadPoolExecutor(max_workers=io_workers) as io_pool:
+            async with asyncio.TaskGroup() as stages:
+                stages.create_task(read_all(io_pool))
+                stages.create_task(convert_all(pool))
+                stages.create_task(write_all(io_pool))
+    except BaseExceptionGroup as group:
+        # Surface the failing read, conversion or write as build() would, not the nested task groups
+        raise first_error(group) from None
+    finally:
+        if isinstance(pool, ThreadPoolExecutor):
+            pool.submit(init_render_cache, None, "").result()
+        pool.shutdown()
+    return totals
+
+
+async def build_async(
+        content_dir: str | Path,
+        public_dir: str | Path,
+        workers: int | None = None,
+        io_workers: int = 8,
+        queue_size: int = 64,
+        force: bool = False,
+        render_cache: str | Path | None = None,
+        ):
+    # Same pages and manifest as build(), but sources are hashed as the pipeline reads them
+    start = perf_counter()
+    content_dir, public_dir = Path(content_dir), Path(public_dir)
+    if not content_dir.is_dir():
+        raise FileNotFoundError(f"Content directory not found: {content_dir}")
+    manifest_path = public_dir / MANIFEST_NAME
+    old_manifest = load_manifest(manifest_path)
+    version = pipeline_version()
+    pages = find_pages(content_dir, public_dir)
+    manifest = {}
+    built: set[str] = set()
+    skipped: set[str] = set()
+
+    def select(source: str, destination: str, digest: str, exists: bool):
+        key, entry = manifest_entry(content_dir, public_dir, source, destination, version, digest)
+        manifest[key] = entry
+        if not force and old_manifest.get(key) == entry and exists:
+            skipped.add(destination)
+            return False
+        built.add(destination)
+        return True
+
+    workers = workers or os.cpu_count() or 1
+    plan_seconds = perf_counter() - start
+    totals = {"cpu": 0.0, "read": 0.0, "write": 0.0}
+    if pages:
+        cache_args = (render_cache, version)
+        totals = await convert_pages_async(pages, workers, io_workers, queue_size, cache_args, select)
+    wall_seconds = perf_counter() - start - plan_seconds
+    removed = remove_stale_outputs(public_dir, old_manifest, manifest)
+    save_manifest(manifest_path, manifest)
+    return AsyncBuildReport(
+        [destination for _, destination in pages if destination in built],
+        [destination for _, destination in pages if destination in skipped],
+        removed, workers,
+        wall_seconds, totals["cpu"], totals["read"], totals["write"], plan_seconds,
+    )
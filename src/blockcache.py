@@ -0,0 +1,132 @@
+import hashlib
+import shelve
+import sys
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable
+from rendercache import RenderCache
+
+
+VERSION_KEY = "__version__"
+
+
+def block_key(block: str):
+    return hashlib.blake2b(block.encode(), digest_size=16).hexdigest()
+
+
+def entry_size(key: str, html: str):
+    return sys.getsizeof(key) + sys.getsizeof(html)
+
+
+class BlockCache():
+    def __init__(
+            self,
+            max_entries: int = 4096,
+            max_bytes: int = 16 * 1024 * 1024,
+            path: str | Path | None = None,
+            version: str = "",
+            backend: RenderCache | None = None,
+            ) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.path = path
+        self.version = version
+        self.backend = backend
+        self.entries: OrderedDict[str, str] = OrderedDict()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.backend_hits = 0
+        self._lock = threading.Lock()
+        if path is not None:
+            self.load()
+
+    def get(self, key: str):
+        with self._lock:
+            html = self.entries.get(key)
+            if html is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return html
+
+    def put(self, key: str, html: str):
+        with self._lock:
+            self._put(key, html)
+
+    def _put(self, key: str, html: str):
+        old_html = self.entries.pop(key, None)
+        if old_html is not None:
+            self.nbytes -= entry_size(key, old_html)
+        size = entry_size(key, html)
+        if size > self.max_bytes:
+            return
+        self.entries[key] = html
+        self.nbytes += size
+        while len(self.entries) > self.max_entries or self.nbytes > self.max_bytes:
+            old_key, old_html = self.entries.popitem(last=False)
+            self.nbytes -= entry_size(old_key, old_html)
+            self.evictions += 1
+
+    def get_or_render(self, block: str, render: Callable[[str], str]):
+        key = block_key(block)
+        html = self.get(key)
+        if html is not None:
+            return html
+        if self.backend is not None:
+            html = self.backend.get("block", key)
+            if html is not None:
+                self.backend_hits += 1
+                self.put(key, html)
+                return html
+        html = render(block)
+        self.put(key, html)
+        if self.backend is not None:
+            self.backend.put("block", key, html)
+        return html
+
+    @property
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self):
+        return {
+            "entries": len(self.entries),
+            "bytes": self.nbytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "backend_hits": self.backend_hits,
+            "hit_rate": self.hit_rate,
+        }
+
+    def clear(self):
+        with self._lock:
+            self.entries.clear()
+            self.nbytes = 0
+
+    def load(self):
+        if self.path is None:
+            raise ValueError("Block cache has no path to load from")
+        with shelve.open(str(self.path), flag="c") as shelf:
+            # Fragments rendered by another pipeline version are stale
+            if shelf.get(VERSION_KEY) != self.version:
+                return
+            for key in shelf:
+                if key != VERSION_KEY:
+                    self.put(key, shelf[key])
+
+    def save(self):
+        if self.path is None:
+            raise ValueError("Block cache has no path to save to")
+        with shelve.open(str(self.path), flag="n") as shelf:
+            shelf[VERSION_KEY] = self.version
+            for key, html in self.entries.items():
+                shelf[key] = html
+
+    def __repr__(self) -> str:
+        return f"BlockCache(entries={len(self.entries)}, bytes={self.nbytes}, hit_rate={self.hit_rate:.2f})"
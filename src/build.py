@@ -0,0 +1,304 @@
+import os
+import json
+import hashlib
+from functools import cache
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from textwrap import dedent
+from typing import Iterable
+import patterns
+import textnode
+import textblock
+import htmlnode
+import markdown_to_html_node as markdown_module
+import mappedfile
+from markdown_to_html_node import BLOCK_CACHE, markdown_to_html
+from blockcache import BlockCache, block_key
+from htmlnode import escape_text
+from rendercache import RenderCache
+from mappedfile import extract_mapped_title, open_mapped, write_mapped_html
+
+
+MANIFEST_NAME = ".build-manifest.json"
+# Set in each worker when the build shares an on-disk render cache
+RENDER_CACHE: RenderCache | None = None
+# Sources at least this large are memory-mapped and converted block by block
+MMAP_THRESHOLD = 64 << 20
+PAGE_TEMPLATE = """<!DOCTYPE html>
+<html>
+  <head>
+    <meta charset="utf-8" />
+    <title>{title}</title>
+    <link rel="stylesheet" href="/styles.css" />
+  </head>
+  <body>
+    {content}
+  </body>
+</html>
+"""
+
+
+def find_title(markdown: str):
+    for line in markdown.split("\n"):
+        if line.startswith("# "):
+            return line[2:].strip()
+    return None
+
+
+def extract_title(markdown: str):
+    # From the dedented text markdown_to_html renders. A "# " line at the start of a line
+    # means there is no common indent, so only pages without one are dedented here.
+    return find_title(markdown) or find_title(dedent(markdown))
+
+
+def render_page(markdown: str, default_title: str = "", cache: BlockCache | None = BLOCK_CACHE):
+    content = markdown_to_html(markdown, cache)
+    title = extract_title(markdown) or default_title
+    return PAGE_TEMPLATE.format(title=escape_text(title), content=content)
+
+
+def init_render_cache(path: str | Path | None, version: str):
+    global RENDER_CACHE
+    if RENDER_CACHE is not None:
+        RENDER_CACHE.close()
+    RENDER_CACHE = RenderCache(path, version) if path else None
+    BLOCK_CACHE.backend = RENDER_CACHE
+
+
+def render_cached_page(markdown: str, default_title: str):
+    if RENDER_CACHE is None:
+        return render_page(markdown, default_title)
+    key = block_key(f"{default_title}\0{markdown}")
+    html = RENDER_CACHE.get("page", key)
+    if html is None:
+        html = render_page(markdown, default_title)
+        RENDER_CACHE.put("page", key, html)
+        # The page and its new blocks in one transaction
+        RENDER_CACHE.flush()
+    return html
+
+
+def write_mapped_page(source: str, destination: str):
+    # Neither the markdown nor the HTML of the page is ever held whole in memory
+    head, tail = PAGE_TEMPLATE.split("{content}")
+    with open_mapped(source) as buffer, open(destination, "w", encoding="utf-8") as file:
+        title = extract_mapped_title(buffer) or Path(source).stem
+        file.write(head.format(title=escape_text(title)))
+        write_mapped_html(buffer, file, BLOCK_CACHE)
+        file.write(tail)
+    if RENDER_CACHE is not None:
+        RENDER_CACHE.flush()
+
+
+def convert_page(job: tuple[str, str]):
+    source, destination = job
+    os.makedirs(os.path.dirname(destination), exist_ok=True)
+    try:
+        if os.path.getsize(source) >= MMAP_THRESHOLD:
+            write_mapped_page(source, destination)
+            return destination
+        with open(source, encoding="utf-8") as file:
+            markdown = file.read()
+        html = render_cached_page(markdown, Path(source).stem)
+    except ValueError as error:
+        # Parser errors only quote the offending text, a pool build needs the page too
+        raise ValueError(f"{source}: {error}") from error
+    with open(destination, "w", encoding="utf-8") as file:
+        file.write(html)
+    return destination
+
+
+def find_pages(content_dir: Path, public_dir: Path):
+    jobs: list[tuple[str, str]] = []
+    for source in sorted(content_dir.rglob("*.md")):
+        destination = public_dir / source.relative_to(content_dir).with_suffix(".html")
+        jobs.append((str(source), str(destination)))
+    return jobs
+
+
+def pipeline_sources():
+    # This module too: it holds the page template, the title extraction and its escaping
+    modules = (patterns, textnode, textblock, htmlnode, markdown_module, mappedfile)
+    return [module.__file__ or "" for module in modules] + [__file__]
+
+
+@cache
+def pipeline_version():
+    # Any change to the conversion code or the page template invalidates every page
+    digest = hashlib.sha256(PAGE_TEMPLATE.encode())
+    for path in pipeline_sources():
+        with open(path, "rb") as file:
+            digest.update(file.read())
+    return digest.hexdigest()
+
+
+def hash_file(path: str):
+    # Streamed, so hashing a memory-mapped page does not read it whole either
+    with open(path, "rb") as file:
+        return hashlib.file_digest(file, "sha256").hexdigest()
+
+
+def load_manifest(manifest_path: Path):
+    try:
+        with open(manifest_path, encoding="utf-8") as file:
+            return json.load(file)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def save_manifest(manifest_path: Path, manifest: dict):
+    manifest_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = manifest_path.with_suffix(".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as file:
+        json.dump(manifest, file, indent=1, sort_keys=True)
+    os.replace(tmp_path, manifest_path)
+
+
+def manifest_entry(
+        content_dir: Path,
+        public_dir: Path,
+        source: str,
+        destination: str,
+        version: str,
+        digest: str | None = None,
+        ):
+    # digest saves reading the source again when the caller already hashed its bytes
+    key = Path(source).relative_to(content_dir).as_posix()
+    entry = {
+        "hash": digest or hash_file(source),
+        "pipeline": version,
+        "output": Path(destination).relative_to(public_dir).as_posix(),
+    }
+    return key, entry
+
+
+def remove_output(public_dir: Path, entry: dict):
+    output = public_dir / entry["output"]
+    if not output.exists():
+        return None
+    output.unlink()
+    return str(output)
+
+
+class BuildReport():
+    def __init__(
+            self,
+            built: list[str],
+            skipped: list[str],
+            removed: list[str],
+            errors: dict[str, Exception] | None = None,
+            ) -> None:
+        self.built = built
+        self.skipped = skipped
+        self.removed = removed
+        # Source -> error for the pages that failed to convert, only collected by update_pages
+        self.errors = errors or {}
+
+    def __repr__(self) -> str:
+        return f"BuildReport(built={len(self.built)}, skipped={len(self.skipped)}, removed={len(self.removed)})"
+
+
+def default_chunksize(nb_jobs: int, workers: int):
+    # A few chunks per worker balances the load without paying IPC per page
+    return max(1, nb_jobs // (workers * 4))
+
+
+def convert_pages(
+        jobs: list[tuple[str, str]],
+        workers: int | None,
+        chunksize: int | None,
+        render_cache: str | Path | None = None,
+        ):
+    workers = workers or os.cpu_count() or 1
+    cache_args = (render_cache, pipeline_version())
+    if workers == 1 or len(jobs) <= 1:
+        init_render_cache(*cache_args)
+        try:
+            return [convert_page(job) for job in jobs]
+        finally:
+            init_render_cache(None, "")
+    chunksize = chunksize or default_chunksize(len(jobs), workers)
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_render_cache, initargs=cache_args) as executor:
+        return list(executor.map(convert_page, jobs, chunksize=chunksize))
+
+
+def remove_stale_outputs(public_dir: Path, old_manifest: dict, sources: Iterable[str]):
+    # Outputs of pages that left the content tree since the previous build
+    sources = set(sources)
+    removed: list[str] = []
+    for key, entry in old_manifest.items():
+        if key in sources:
+            continue
+        output = remove_output(public_dir, entry)
+        if output:
+            removed.append(output)
+    return removed
+
+
+def plan_build(content_dir: Path, public_dir: Path, force: bool = False):
+    # Compare the content tree with the previous manifest: which pages to convert, keep or remove
+    if not content_dir.is_dir():
+        raise FileNotFoundError(f"Content directory not found: {content_dir}")
+    manifest_path = public_dir / MANIFEST_NAME
+    old_manifest = load_manifest(manifest_path)
+    version = pipeline_version()
+    manifest = {}
+    jobs: list[tuple[str, str]] = []
+    skipped: list[str] = []
+    for source, destination in find_pages(content_dir, public_dir):
+        key, entry = manifest_entry(content_dir, public_dir, source, destination, version)
+        manifest[key] = entry
+        if not force and old_manifest.get(key) == entry and os.path.exists(destination):
+            skipped.append(destination)
+        else:
+            jobs.append((source, destination))
+    removed = remove_stale_outputs(public_dir, old_manifest, manifest)
+    return manifest_path, manifest, jobs, skipped, removed
+
+
+def build(
+        content_dir: str | Path,
+        public_dir: str | Path,
+        workers: int | None = None,
+        chunksize: int | None = None,
+        force: bool = False,
+        render_cache: str | Path | None = None,
+        ):
+    content_dir, public_dir = Path(content_dir), Path(public_dir)
+    manifest_path, manifest, jobs, skipped, removed = plan_build(content_dir, public_dir, force)
+    built = convert_pages(jobs, workers, chunksize, render_cache)
+    save_manifest(manifest_path, manifest)
+    return BuildReport(built, skipped, removed)
+
+
+def update_pages(
+        content_dir: str | Path,
+        public_dir: str | Path,
+        changed: list[str],
+        removed: list[str],
+        ):
+    # Rebuild a known set of sources without rescanning the whole content tree.
+    # Each page is converted on its own: one that fails keeps its previous manifest entry and output.
+    content_dir, public_dir = Path(content_dir), Path(public_dir)
+    manifest_path = public_dir / MANIFEST_NAME
+    manifest = load_manifest(manifest_path)
+    version = pipeline_version()
+    removed_outputs: list[str] = []
+    for source in removed:
+        entry = manifest.pop(Path(source).relative_to(content_dir).as_posix(), None)
+        output = remove_output(public_dir, entry) if entry else None
+        if output:
+            removed_outputs.append(output)
+    built: list[str] = []
+    errors: dict[str, Exception] = {}
+    for source in changed:
+        destination = public_dir / Path(source).relative_to(content_dir).with_suffix(".html")
+        try:
+            key, entry = manifest_entry(content_dir, public_dir, source, str(destination), version)
+            built.append(convert_page((source, str(destination))))
+        except (ValueError, OSError) as error:
+            errors[source] = error
+            continue
+        manifest[key] = entry
+    save_manifest(manifest_path, manifest)
+    return BuildReport(built, [], removed_outputs, errors)
@@ -1,7 +1,44 @@
+from typing import Iterator, TextIO
 from textnode import TextNode, TextType
 
 
+def escape_text(text: str):
+    # Most text has nothing to escape: three substring checks beat any replace or regex
+    if "&" not in text and "<" not in text and ">" not in text:
+        return text
+    return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+
+
+def escape_attribute(value: str):
+    if "&" not in value and "<" not in value and ">" not in value and '"' not in value:
+        return value
+    return value.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;").replace('"', "&quot;")
+
+
+def _serialize_props(props: dict):
+    return " " + " ".join([f'{key}="{escape_attribute(str(value))}"' for key, value in props.items()])
+
+
+SERIALIZED_PROPS_LIMIT = 65_536
+_serialized_props: dict[tuple, str] = {}
+
+
+def serialize_props(props: dict):
+    try:
+        key = tuple(props.items())
+        serialized = _serialized_props.get(key)
+    except TypeError: # unhashable values are serialized every time
+        return _serialize_props(props)
+    if serialized is None:
+        if len(_serialized_props) >= SERIALIZED_PROPS_LIMIT:
+            _serialized_props.clear()
+        serialized = _serialized_props[key] = _serialize_props(props)
+    return serialized
+
+
 class HTMLNode():
+    __slots__ = ("tag", "value", "children", "props")
+
     def __init__(
             self, 
             tag: str | None = None, 
@@ -15,12 +52,25 @@ class HTMLNode():
         self.props = props
 
     def to_html(self):
+        return "".join(self.iter_html())
+
+    def iter_html(self) -> Iterator[str]:
         raise NotImplementedError
+
+    def validate(self):
+        pass
+
+    def write_html(self, stream: TextIO):
+        # Checked up front: an invalid node deep in the tree must not leave half a document in the stream
+        self.validate()
+        write = stream.write
+        for chunk in self.iter_html():
+            write(chunk)
     
     def props_to_html(self):
         if not self.props:
             return ""
-        return " " + " ".join([f'{key}="{self.props[key]}"' for key in self.props])
+        return serialize_props(self.props)
     
     def __repr__(self) -> str:
         return f"HTMLNode(tag={self.tag}, value={self.value}, children={self.children}, props={self.props})"
@@ -39,6 +89,8 @@ class HTMLNode():
     
 
 class LeafNode(HTMLNode):
+    __slots__ = ()
+
     def __init__(
             self, 
             tag: str | None, 
@@ -51,11 +103,20 @@ class LeafNode(HTMLNode):
         if self.value is None:
             raise ValueError("Leaf Node must have a value")
         if self.tag is None:
-            return self.value
-        return f"<{self.tag}{self.props_to_html()}>{self.value}</{self.tag}>"
+            return escape_text(self.value)
+        return f"<{self.tag}{self.props_to_html()}>{escape_text(self.value)}</{self.tag}>"
+
+    def validate(self):
+        if self.value is None:
+            raise ValueError("Leaf Node must have a value")
+
+    def iter_html(self):
+        yield self.to_html()
 
 
 class ParentNode(HTMLNode):
+    __slots__ = ()
+
     def __init__(
             self, 
             tag: str, 
@@ -64,45 +125,93 @@ class ParentNode(HTMLNode):
             ) -> None:
         super().__init__(tag=tag, value=None, children=children, props=props)
     
-    def to_html(self):
+    def open_tag(self):
         if not self.tag:
             raise ValueError("Parent node must have a tag")
         if not self.children:
             raise ValueError("Parent node must have children")
-        if not all(isinstance(child, HTMLNode) for child in self.children):
-            raise TypeError("All children must be instances of HTMLNode")
-        result = f"<{self.tag}{self.props_to_html()}>"
-        for node in self.children:
-            result += node.to_html()
-        result += f"</{self.tag}>"
-        return result
+        return f"<{self.tag}{self.props_to_html()}>"
+
+    def validate(self):
+        # Same errors as iter_html, in document order, without rendering anything
+        stack: list[object] = [self]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, LeafNode):
+                if node.value is None:
+                    raise ValueError("Leaf Node must have a value")
+            elif isinstance(node, ParentNode):
+                if not node.tag:
+                    raise ValueError("Parent node must have a tag")
+                if not node.children:
+                    raise ValueError("Parent node must have children")
+                stack.extend(reversed(node.children))
+            elif isinstance(node, HTMLNode):
+                node.validate()
+            else:
+                raise TypeError("All children must be instances of HTMLNode")
+
+    def iter_html(self):
+        # Explicit stack instead of recursion: nesting depth is only bounded by memory
+        yield self.open_tag()
+        stack = [(iter(self.children), self.tag)]
+        while stack:
+            children, tag = stack[-1]
+            for child in children:
+                if isinstance(child, LeafNode):
+                    yield child.to_html()
+                elif isinstance(child, ParentNode):
+                    yield child.open_tag()
+                    stack.append((iter(child.children), child.tag))
+                    break
+                elif isinstance(child, HTMLNode):
+                    yield from child.iter_html()
+                else:
+                    raise TypeError("All children must be instances of HTMLNode")
+            else:
+                stack.pop()
+                yield f"</{tag}>"
+
+
+# Interned props are shared between nodes: treat them as read-only
+PROPS_CACHE_LIMIT = 65_536
+_props_cache: dict[tuple[tuple[str, str | None], ...], dict] = {}
+
+
+def intern_props(*items: tuple[str, str | None]):
+    props = _props_cache.get(items)
+    if props is None:
+        if len(_props_cache) >= PROPS_CACHE_LIMIT:
+            _props_cache.clear()
+        props = _props_cache[items] = dict(items)
+    return props
 
 
 def text_node_to_html_node(text_node: TextNode):
     tt = text_node.text_type
     match tt:
         case TextType.TEXT:
-            return HTMLNode(value=text_node.text)
+            return LeafNode(None, text_node.text)
         case TextType.BOLD:
-            return HTMLNode(tag="b", value=text_node.text)
+            return LeafNode("b", text_node.text)
         case TextType.ITALIC:
-            return HTMLNode(tag="i", value=text_node.text)
+            return LeafNode("i", text_node.text)
         case TextType.CODE:
-            return HTMLNode(tag="code", value=text_node.text)
+            return LeafNode("code", text_node.text)
         case TextType.LINK:
-            return HTMLNode(
-                tag="a", 
-                value=text_node.text, 
-                props={"href": text_node.url},
+            return LeafNode(
+                "a", 
+                text_node.text, 
+                intern_props(("href", text_node.url)),
                 )
         case TextType.IMAGE:
-            return HTMLNode(
-                tag="img", 
-                value="", 
-                props={
-                    "src": text_node.url,
-                    "alt": text_node.text
-                    },
+            return LeafNode(
+                "img", 
+                "", 
+                intern_props(
+                    ("src", text_node.url),
+                    ("alt", text_node.text),
+                    ),
                 )
         case _:
-            raise AttributeError(f"Unsupported TextType enum value {text_node.text_type}")
\ No newline at end of file
+            raise AttributeError(f"Unsupported TextType enum value {text_node.text_type}")
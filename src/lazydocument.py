@@ -0,0 +1,73 @@
+from io import StringIO
+from itertools import islice
+from typing import Iterable, Iterator, TextIO
+from htmlnode import HTMLNode, ParentNode
+from textnode import iter_blocks
+from markdown_to_html_node import markdown_block_to_html_node
+
+
+class LazyDocument():
+    def __init__(self, source: str | Iterable[str], tag: str = "div", cache_nodes: bool = True) -> None:
+        if isinstance(source, str):
+            source = StringIO(source)
+        self.tag = tag
+        self.cache_nodes = cache_nodes
+        self._blocks = iter_blocks(source)
+        self._nodes: list[HTMLNode] = []
+        self._consumed = False
+        self.blocks_parsed = 0
+
+    def _parse_next(self):
+        block = next(self._blocks, None)
+        if block is None:
+            return None
+        node = markdown_block_to_html_node(block)
+        self.blocks_parsed += 1
+        if self.cache_nodes:
+            self._nodes.append(node)
+        return node
+
+    def __iter__(self) -> Iterator[HTMLNode]:
+        # Blocks are parsed and converted only when the iteration reaches them
+        if not self.cache_nodes:
+            if self._consumed:
+                raise RuntimeError("Document nodes are not cached and were already consumed")
+            self._consumed = True
+        index = 0
+        while True:
+            if index < len(self._nodes):
+                node = self._nodes[index]
+            else:
+                node = self._parse_next()
+                if node is None:
+                    return
+            yield node
+            index += 1
+
+    def head(self, count: int):
+        return list(islice(self, count))
+
+    def excerpt(self, count: int):
+        nodes = self.head(count)
+        if not nodes:
+            return ""
+        return ParentNode(self.tag, nodes).to_html()
+
+    def iter_html(self):
+        yield f"<{self.tag}>"
+        for node in self:
+            yield from node.iter_html()
+        yield f"</{self.tag}>"
+
+    def to_html(self):
+        return "".join(self.iter_html())
+
+    def write_html(self, stream: TextIO):
+        # Blocks are parsed as they are written: one that fails leaves the earlier ones in the stream,
+        # so write to a temporary file and replace the target when that matters
+        write = stream.write
+        for chunk in self.iter_html():
+            write(chunk)
+
+    def __repr__(self) -> str:
+        return f"LazyDocument(tag={self.tag}, blocks_parsed={self.blocks_parsed})"
@@ -1,10 +1,102 @@
-from textnode import TextNode, TextType
+import argparse
+import asyncio
+import threading
+from pathlib import Path
+from time import perf_counter
+from asyncbuild import build_async
+from build import build
+from profiling import Profiler
+from watch import start_server, watch
 
 
-def main():
-    textNode = TextNode("This is some anchor text", TextType.TEXT, "https://www.boot.dev")
-    print(textNode)
+ROOT_DIR = Path(__file__).resolve().parent.parent
+
+
+def parse_args(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description="Static site generator")
+    commands = parser.add_subparsers(dest="command", required=True)
+    build_parser = commands.add_parser("build", help="convert every markdown page to HTML")
+    build_parser.add_argument("--content", type=Path, default=ROOT_DIR / "content", help="markdown source directory")
+    build_parser.add_argument("--public", type=Path, default=ROOT_DIR / "public", help="HTML output directory")
+    build_parser.add_argument("--workers", type=int, default=None, help="worker processes (default: all cores)")
+    build_parser.add_argument("--chunksize", type=int, default=None, help="pages sent to a worker at once")
+    build_parser.add_argument("--force", action="store_true", help="rebuild every page, ignoring the manifest")
+    build_parser.add_argument("--render-cache", type=Path, default=None, help="SQLite file shared by workers for rendered HTML")
+    build_parser.add_argument("--async", dest="use_async", action="store_true", help="overlap file reads and writes with the conversion")
+    build_parser.add_argument("--io-workers", type=int, default=8, help="concurrent reads and writes with --async")
+    build_parser.add_argument("--profile", action="store_true", help="print per-stage timings (builds in one process)")
+    build_parser.add_argument("--trace", type=Path, default=None, help="write a Chrome trace of the stages (implies --profile)")
+    serve_parser = commands.add_parser("serve", help="serve the public directory over HTTP")
+    serve_parser.add_argument("--content", type=Path, default=ROOT_DIR / "content", help="markdown source directory")
+    serve_parser.add_argument("--public", type=Path, default=ROOT_DIR / "public", help="HTML output directory")
+    serve_parser.add_argument("--port", type=int, default=8888, help="HTTP port")
+    serve_parser.add_argument("--watch", action="store_true", help="rebuild pages when their markdown changes")
+    serve_parser.add_argument("--interval", type=float, default=0.2, help="seconds between polls of the content tree")
+    serve_parser.add_argument("--debounce", type=float, default=0.3, help="quiet seconds before rebuilding")
+    args = parser.parse_args(argv)
+    command_parser = build_parser if args.command == "build" else serve_parser
+    if (args.command == "build" or args.watch) and not args.content.is_dir():
+        command_parser.error(f"content directory not found: {args.content}")
+    return args
+
+
+def main(argv: list[str] | None = None):
+    args = parse_args(argv)
+    if args.command == "build":
+        profiler = Profiler(memory=True, trace=args.trace is not None) if args.profile or args.trace else None
+        start = perf_counter()
+        if profiler:
+            profiler.enable()
+        try:
+            if args.use_async:
+                report = asyncio.run(build_async(
+                    args.content,
+                    args.public,
+                    workers=1 if profiler else args.workers,
+                    io_workers=args.io_workers,
+                    force=args.force,
+                    render_cache=args.render_cache,
+                    ))
+            else:
+                report = build(
+                    args.content,
+                    args.public,
+                    workers=1 if profiler else args.workers,
+                    chunksize=args.chunksize,
+                    force=args.force,
+                    render_cache=args.render_cache,
+                    )
+        finally:
+            if profiler:
+                profiler.disable()
+        print(
+            f"Built {len(report.built)} pages in {perf_counter() - start:.2f}s"
+            f" ({len(report.skipped)} unchanged, {len(report.removed)} removed)"
+        )
+        if args.use_async:
+            print(
+                f"Conversion busy {report.cpu_seconds:.2f}s on {report.workers} workers,"
+                f" overlap efficiency {report.overlap_efficiency:.0%}"
+                f" (reads {report.read_seconds:.2f}s, writes {report.write_seconds:.2f}s,"
+                f" scanning the content tree {report.plan_seconds:.2f}s)"
+            )
+        if profiler:
+            print(profiler.format_table())
+        if profiler and args.trace:
+            profiler.write_chrome_trace(args.trace)
+    elif args.command == "serve":
+        server = start_server(args.public, port=args.port)
+        print(f"Serving {args.public} on http://localhost:{server.server_address[1]}")
+        try:
+            if args.watch:
+                watch(args.content, args.public, interval=args.interval, debounce=args.debounce)
+            else:
+                threading.Event().wait()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.shutdown()
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
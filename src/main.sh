@@ -1 +1 @@
-python3 ./main.py
\ No newline at end of file
+python3 ./main.py build
\ No newline at end of file
@@ -0,0 +1,139 @@
+import mmap
+import os
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TextIO
+from blockcache import BlockCache
+from patterns import BLOCK_BREAK_PATTERN, LEADING_WHITESPACE_PATTERN, MAPPED_TITLE_PATTERN, NEWLINE_PATTERN
+from markdown_to_html_node import iter_parallel_html, markdown_block_to_html
+
+
+# Pages already scanned are handed back to the OS in steps of this size
+RELEASE_BYTES = 64 << 20
+
+
+@contextmanager
+def open_mapped(path: str | Path):
+    with open(path, "rb") as file:
+        # Empty files cannot be mapped
+        if file.seek(0, 2) == 0:
+            yield b""
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            yield buffer
+
+
+def fenced_block_end(buffer: bytes | mmap.mmap, start: int, encoding: str):
+    # Same line rules as iter_blocks, only walked for blocks that contain a fence.
+    # Returns where the block ends and where the next one starts.
+    size = len(buffer)
+    in_fence = False
+    position = start
+    while position < size:
+        newline = NEWLINE_PATTERN.search(buffer, position)
+        end, next_position = (newline.start(), newline.end()) if newline else (size, size)
+        line = buffer[position:end]
+        if b"```" in line:
+            stripped = line.decode(encoding).strip()
+            if stripped.startswith("```"):
+                if in_fence or len(stripped) < 6 or not stripped.endswith("```"):
+                    in_fence = not in_fence
+        if not line.strip(b" \t") and not in_fence:
+            return position, next_position
+        position = next_position
+    return size, size
+
+
+def find_margin(buffer: bytes | mmap.mmap):
+    # The indent textwrap.dedent would remove from every line, most often settled by the first line
+    margin = None
+    for match in LEADING_WHITESPACE_PATTERN.finditer(buffer):
+        indent = match.group(1)
+        if margin is None or margin.startswith(indent):
+            margin = indent
+        elif not indent.startswith(margin):
+            margin = os.path.commonprefix((margin, indent))
+        if not margin:
+            return ""
+    return (margin or b"").decode("ascii")
+
+
+def dedent_block(block: str, margin: str):
+    # textwrap.dedent on a single block: blank lines are emptied, then the margin is removed
+    lines = block.split("\n")
+    for index, line in enumerate(lines):
+        if not line.strip(" \t"):
+            lines[index] = ""
+        elif line.startswith(margin):
+            lines[index] = line[len(margin):]
+    return "\n".join(lines)
+
+
+def decode_block(chunk: bytes, encoding: str, margin: str = ""):
+    block = chunk.decode(encoding)
+    if "\r" in block:
+        block = block.replace("\r\n", "\n").replace("\r", "\n")
+    # Blank lines only remain inside fences, every other one is a block break
+    if margin or "```" in block:
+        block = dedent_block(block, margin)
+    return block.strip()
+
+
+def iter_mapped_blocks(buffer: bytes | mmap.mmap, encoding: str = "utf-8"):
+    # Block boundaries are found on the bytes, only the current block is decoded.
+    # Newline bytes never occur inside a multi-byte UTF-8 character.
+    size = len(buffer)
+    margin = find_margin(buffer)
+    release = getattr(buffer, "madvise", None) if hasattr(mmap, "MADV_DONTNEED") else None
+    released = 0
+    position = 0
+    while position < size:
+        block_break = BLOCK_BREAK_PATTERN.search(buffer, position)
+        end, next_position = (block_break.start(), block_break.end()) if block_break else (size, size)
+        chunk = buffer[position:end]
+        if b"```" in chunk:
+            end, next_position = fenced_block_end(buffer, position, encoding)
+            chunk = buffer[position:end]
+        position = next_position
+        block = decode_block(chunk, encoding, margin)
+        if block:
+            yield block
+        if release and position - released >= RELEASE_BYTES:
+            # Mapped pages count towards RSS until they are dropped
+            boundary = position // mmap.ALLOCATIONGRANULARITY * mmap.ALLOCATIONGRANULARITY
+            release(mmap.MADV_DONTNEED, released, boundary - released)
+            released = boundary
+
+
+def extract_mapped_title(buffer: bytes | mmap.mmap, encoding: str = "utf-8"):
+    # A title line is indented by exactly the margin, so it starts with "# " once dedented
+    margin = find_margin(buffer).encode("ascii")
+    for match in MAPPED_TITLE_PATTERN.finditer(buffer):
+        if match.group(1) == margin:
+            return match.group(2).decode(encoding).strip()
+    return None
+
+
+def write_mapped_html(
+        buffer: bytes | mmap.mmap,
+        stream: TextIO,
+        cache: BlockCache | None = None,
+        workers: int = 1,
+        ):
+    blocks = iter_mapped_blocks(buffer)
+    if workers != 1:
+        fragments = iter_parallel_html(blocks, workers)
+    elif cache is None:
+        fragments = map(markdown_block_to_html, blocks)
+    else:
+        fragments = (cache.get_or_render(block, markdown_block_to_html) for block in blocks)
+    write = stream.write
+    write("<div>")
+    for fragment in fragments:
+        write(fragment)
+    write("</div>")
+
+
+def mapped_markdown_to_html(path: str | Path, stream: TextIO, cache: BlockCache | None = None, workers: int = 1):
+    with open_mapped(path) as buffer:
+        write_mapped_html(buffer, stream, cache, workers)
@@ -0,0 +1,115 @@
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from textwrap import dedent
+from typing import Iterable, Iterator, Literal
+from textnode import markdown_to_blocks
+from textblock import BlockType, classify_block, block_to_html_node
+from htmlnode import ParentNode
+from blockcache import BlockCache
+
+
+# Process-wide cache shared by batch conversions and builds in this process
+BLOCK_CACHE = BlockCache()
+
+
+def markdown_block_to_html_node(block: str):
+    block_type, lines = classify_block(block)
+    if block_type == BlockType.PARAGRAPH:
+        # Soft line breaks inside a paragraph render as a single space
+        block = " ".join(line.strip() for line in lines)
+        lines = [block]
+    return block_to_html_node(block, block_type, lines)
+
+
+def markdown_block_to_html(block: str):
+    return markdown_block_to_html_node(block).to_html()
+
+
+def markdown_to_html_node(markdown: str):
+    markdown = dedent(markdown)
+    html_nodes = [markdown_block_to_html_node(block) for block in markdown_to_blocks(markdown)]
+    return ParentNode("div", html_nodes)
+
+
+def markdown_to_html(markdown: str, cache: BlockCache | None = None):
+    markdown = dedent(markdown)
+    fragments = ["<div>"]
+    for block in markdown_to_blocks(markdown):
+        if cache is None:
+            fragments.append(markdown_block_to_html(block))
+        else:
+            fragments.append(cache.get_or_render(block, markdown_block_to_html))
+    fragments.append("</div>")
+    return "".join(fragments)
+
+
+def markdown_to_html_shared(markdown: str):
+    return markdown_to_html(markdown, BLOCK_CACHE)
+
+
+def markdown_to_html_many(
+        docs: Iterable[str],
+        cache: BlockCache | None = BLOCK_CACHE,
+        executor: Literal["thread", "process"] | None = None,
+        workers: int | None = None,
+        chunksize: int = 64,
+        ):
+    docs = list(docs)
+    if executor is None:
+        return [markdown_to_html(doc, cache) for doc in docs]
+    workers = workers or os.cpu_count() or 1
+    if executor == "thread":
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(lambda doc: markdown_to_html(doc, cache), docs))
+    if executor == "process":
+        # A cache object cannot be shared across processes: each worker uses its own BLOCK_CACHE
+        if cache is not None and cache is not BLOCK_CACHE:
+            raise ValueError("executor='process' only supports cache=BLOCK_CACHE or cache=None")
+        convert = markdown_to_html_shared if cache is BLOCK_CACHE else markdown_to_html
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(convert, docs, chunksize=chunksize))
+    raise ValueError(f"Unsupported executor '{executor}'")
+
+
+def render_blocks(blocks: list[str]):
+    # Workers send back one HTML string per chunk, much cheaper to pickle than node trees
+    return "".join([markdown_block_to_html(block) for block in blocks])
+
+
+def iter_block_chunks(blocks: Iterable[str], chunk_bytes: int):
+    chunk: list[str] = []
+    size = 0
+    for block in blocks:
+        chunk.append(block)
+        size += len(block)
+        if size >= chunk_bytes:
+            yield chunk
+            chunk = []
+            size = 0
+    if chunk:
+        yield chunk
+
+
+def iter_parallel_html(blocks: Iterable[str], workers: int | None = None, chunk_bytes: int = 256 << 10) -> Iterator[str]:
+    workers = workers or os.cpu_count() or 1
+    chunks = iter_block_chunks(blocks, chunk_bytes)
+    if workers == 1:
+        for chunk in chunks:
+            yield render_blocks(chunk)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        # A bounded window of chunks in flight, so a streamed source is never read whole
+        pending = deque()
+        for chunk in chunks:
+            pending.append(pool.submit(render_blocks, chunk))
+            if len(pending) >= workers * 2:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def markdown_to_html_parallel(markdown: str, workers: int | None = None, chunk_bytes: int = 256 << 10):
+    markdown = dedent(markdown)
+    fragments = iter_parallel_html(markdown_to_blocks(markdown), workers, chunk_bytes)
+    return "".join(["<div>", *fragments, "</div>"])
@@ -0,0 +1,152 @@
+import re
+from contextlib import contextmanager
+from time import perf_counter
+
+
+class RegexPattern():
+    def __init__(self, name: str, pattern: str | bytes, flags: int = 0) -> None:
+        self.name = name
+        self.regex = re.compile(pattern, flags)
+        self.calls = 0
+        self.hits = 0
+        self.seconds = 0.0
+        self.track(False)
+
+    def track(self, enabled: bool):
+        # Untracked patterns expose the compiled methods directly: no overhead
+        regex = self.regex
+        if not enabled:
+            self.search = regex.search
+            self.match = regex.match
+            self.findall = regex.findall
+            self.finditer = regex.finditer
+            return
+        self.search = self._timed(regex.search)
+        self.match = self._timed(regex.match)
+        self.findall = self._timed(regex.findall)
+        self.finditer = self._timed_finditer
+
+    def _timed(self, method):
+        def timed(*args, **kwargs):
+            start = perf_counter()
+            result = method(*args, **kwargs)
+            self.seconds += perf_counter() - start
+            self.calls += 1
+            if result:
+                self.hits += 1
+            return result
+        return timed
+
+    def _timed_finditer(self, *args, **kwargs):
+        start = perf_counter()
+        matches = list(self.regex.finditer(*args, **kwargs))
+        self.seconds += perf_counter() - start
+        self.calls += 1
+        if matches:
+            self.hits += 1
+        return iter(matches)
+
+    @property
+    def misses(self):
+        return self.calls - self.hits
+
+    def reset(self):
+        self.calls = 0
+        self.hits = 0
+        self.seconds = 0.0
+
+    def __repr__(self) -> str:
+        return f"RegexPattern({self.name}, {self.regex.pattern!r})"
+
+
+PATTERNS: dict[str, RegexPattern] = {}
+_tracking = False
+
+
+def register(name: str, pattern: str | bytes, flags: int = 0):
+    if name in PATTERNS:
+        raise ValueError(f"Pattern '{name}' is already registered")
+    regex_pattern = RegexPattern(name, pattern, flags)
+    regex_pattern.track(_tracking)
+    PATTERNS[name] = regex_pattern
+    return regex_pattern
+
+
+def enable_stats():
+    global _tracking
+    _tracking = True
+    for pattern in PATTERNS.values():
+        pattern.track(True)
+
+
+def disable_stats():
+    global _tracking
+    _tracking = False
+    for pattern in PATTERNS.values():
+        pattern.track(False)
+
+
+def reset_stats():
+    for pattern in PATTERNS.values():
+        pattern.reset()
+
+
+@contextmanager
+def collect_stats():
+    reset_stats()
+    enable_stats()
+    try:
+        yield PATTERNS
+    finally:
+        disable_stats()
+
+
+def pattern_stats():
+    return {
+        name: {
+            "calls": pattern.calls,
+            "hits": pattern.hits,
+            "misses": pattern.misses,
+            "seconds": pattern.seconds,
+        }
+        for name, pattern in PATTERNS.items()
+    }
+
+
+def format_stats():
+    lines = [f"{'pattern':<20} {'calls':>10} {'hits':>10} {'misses':>10} {'ms':>10}"]
+    for name, pattern in PATTERNS.items():
+        lines.append(
+            f"{name:<20} {pattern.calls:>10} {pattern.hits:>10} {pattern.misses:>10} {pattern.seconds * 1e3:>10.3f}"
+        )
+    return "\n".join(lines)
+
+
+# Inline patterns
+IMAGE_PATTERN = register("image", r"!\[(?P<text>.*?)\]\((?P<url>.*?)\)") # ![<text>](<url>)
+LINK_PATTERN = register("link", r"\[(?P<text>.*?)\]\((?P<url>.*?)\)") # [<text>](<url>)
+
+# Link/image parts cannot contain a delimiter: the pipeline splits delimiters first
+_URL_PART = r"(?:[^_`*\n]|\*(?!\*))*?"
+_IMAGE = rf"!\[(?P<alt>{_URL_PART})\]\((?P<src>{_URL_PART})\)" # ![<text>](<url>)
+# Images are extracted before links, so a link cannot contain one: tokenize_inline checks a link's span
+# with INLINE_IMAGE_PATTERN rather than a lookahead at every "!", which backtracks on unclosed syntax
+_LINK = rf"\[(?P<text>{_URL_PART})\]\((?P<href>{_URL_PART})\)" # [<text>](<url>)
+INLINE_TOKEN_PATTERN = register("inline_token", rf"(?P<delimiter>\*\*|_|`)|{_IMAGE}|{_LINK}")
+INLINE_IMAGE_PATTERN = register("inline_image", _IMAGE)
+# Inside a span, any delimiter of higher precedence means the span is unclosed
+BOLD_CLOSE_PATTERN = register("bold_close", r"\*\*")
+ITALIC_CLOSE_PATTERN = register("italic_close", r"\*\*|_")
+CODE_CLOSE_PATTERN = register("code_close", r"\*\*|_|`")
+
+# Block patterns
+HEADING_PATTERN = register("heading", r"(?P<pounds>#*) ")
+
+# Memory-mapped input, matched on the raw bytes. Newlines are \n, \r\n or \r as in a text-mode read;
+# atomic groups keep a single \r\n from counting as two line ends.
+NEWLINE_PATTERN = register("newline", rb"\r\n?|\n")
+# A line of spaces and tabs is blank, as after textwrap.dedent
+BLOCK_BREAK_PATTERN = register("block_break", rb"(?>\r\n?|\n)[ \t]*(?>\r\n?|\n)")
+# Indent of each non-blank line, the lookbehind standing for ^ after any of the newlines
+LEADING_WHITESPACE_PATTERN = register("leading_whitespace", rb"(?<![^\r\n])([ \t]*)[^ \t\r\n]")
+MAPPED_TITLE_PATTERN = register("mapped_title", rb"(?<![^\r\n])([ \t]*)# ([^\r\n]*)")
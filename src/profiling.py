@@ -0,0 +1,146 @@
+import json
+import os
+import sys
+import threading
+import tracemalloc
+from functools import wraps
+from pathlib import Path
+from time import perf_counter
+from typing import Callable
+import textnode
+import textblock
+import htmlnode
+from htmlnode import HTMLNode
+
+
+SRC_DIR = Path(__file__).resolve().parent
+
+
+def delimiter_label(name: str):
+    def label(old_nodes, delimiter, text_type):
+        return f"{name}[{delimiter}]"
+    return label
+
+
+# Stage name -> (owner, attribute, optional label from the call arguments)
+STAGES: dict[str, tuple[object, str, Callable[..., str] | None]] = {
+    "markdown_to_blocks": (textnode, "markdown_to_blocks", None),
+    "classify_block": (textblock, "classify_block", None),
+    "block_to_block_type": (textblock, "block_to_block_type", None),
+    "tokenize_inline": (textnode, "tokenize_inline", None),
+    "split_nodes_delimiter": (textnode, "split_nodes_delimiter", delimiter_label("split_nodes_delimiter")),
+    "split_nodes_image": (textnode, "split_nodes_image", None),
+    "split_nodes_link": (textnode, "split_nodes_link", None),
+    "text_node_to_html_node": (htmlnode, "text_node_to_html_node", None),
+    "to_html": (HTMLNode, "to_html", None),
+}
+
+
+class StageStats():
+    __slots__ = ("calls", "seconds", "bytes")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.seconds = 0.0
+        self.bytes = 0
+
+
+class Profiler():
+    def __init__(self, memory: bool = False, trace: bool = False) -> None:
+        self.memory = memory
+        self.trace = trace
+        self.stats: dict[str, StageStats] = {}
+        self.events: list[dict] = []
+        self._patches: list[tuple[object, str, object]] = []
+        self._started_tracemalloc = False
+        self._origin = 0.0
+
+    def _wrap(self, name: str, func: Callable, label: Callable[..., str] | None):
+        stats = self.stats
+        events = self.events
+        memory = self.memory
+        trace = self.trace
+        origin = self._origin
+
+        @wraps(func)
+        def profiled(*args, **kwargs):
+            stage = label(*args, **kwargs) if label else name
+            allocated = tracemalloc.get_traced_memory()[0] if memory else 0
+            start = perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                seconds = perf_counter() - start
+                stage_stats = stats.get(stage)
+                if stage_stats is None:
+                    stage_stats = stats[stage] = StageStats()
+                stage_stats.calls += 1
+                stage_stats.seconds += seconds
+                if memory:
+                    stage_stats.bytes += max(0, tracemalloc.get_traced_memory()[0] - allocated)
+                if trace:
+                    events.append({
+                        "name": stage,
+                        "ph": "X",
+                        "ts": (start - origin) * 1e6,
+                        "dur": seconds * 1e6,
+                        "pid": os.getpid(),
+                        "tid": threading.get_ident(),
+                    })
+        return profiled
+
+    def _patch(self, owner: object, attribute: str, value: object):
+        self._patches.append((owner, attribute, getattr(owner, attribute)))
+        setattr(owner, attribute, value)
+
+    def enable(self):
+        if self._patches:
+            return
+        self._origin = perf_counter()
+        if self.memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+        for name, (owner, attribute, label) in STAGES.items():
+            original = getattr(owner, attribute)
+            profiled = self._wrap(name, original, label)
+            if isinstance(owner, type):
+                self._patch(owner, attribute, profiled)
+                continue
+            # Modules that imported the function by name hold their own reference
+            for module in list(sys.modules.values()):
+                module_file = getattr(module, "__file__", None)
+                if not module_file or Path(module_file).resolve().parent != SRC_DIR:
+                    continue
+                if getattr(module, attribute, None) is original:
+                    self._patch(module, attribute, profiled)
+
+    def disable(self):
+        while self._patches:
+            owner, attribute, original = self._patches.pop()
+            setattr(owner, attribute, original)
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    def __enter__(self):
+        self.enable()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.disable()
+
+    def format_table(self):
+        lines = [f"{'stage':<28} {'calls':>10} {'ms':>10} {'us/call':>9} {'KB':>10}"]
+        for stage, stats in sorted(self.stats.items(), key=lambda item: -item[1].seconds):
+            lines.append(
+                f"{stage:<28} {stats.calls:>10} {stats.seconds * 1e3:>10.2f}"
+                f" {stats.seconds * 1e6 / stats.calls:>9.2f} {stats.bytes / 1024:>10.1f}"
+            )
+        return "\n".join(lines)
+
+    def chrome_trace(self):
+        return {"traceEvents": self.events, "displayTimeUnit": "ms"}
+
+    def write_chrome_trace(self, path: str | Path):
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(self.chrome_trace(), file)
@@ -0,0 +1,89 @@
+import os
+import sqlite3
+from pathlib import Path
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS fragments (
+    version TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    key TEXT NOT NULL,
+    html TEXT NOT NULL,
+    PRIMARY KEY (version, kind, key)
+) WITHOUT ROWID
+"""
+# Buffered writes are committed once this many are pending, even before the page is done
+FLUSH_SIZE = 1024
+
+
+class RenderCache():
+    def __init__(self, path: str | Path, version: str, timeout: float = 30.0) -> None:
+        self.path = str(path)
+        self.version = version
+        self.timeout = timeout
+        self._connection: sqlite3.Connection | None = None
+        self._pid: int | None = None
+        # Written in one transaction by flush(): every autocommitted insert would take the WAL write lock
+        self._pending: dict[tuple[str, str], str] = {}
+
+    @property
+    def connection(self):
+        # SQLite connections must not cross a fork: each worker opens its own
+        if self._connection is None or self._pid != os.getpid():
+            connection = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute(SCHEMA)
+            self._connection = connection
+            self._pid = os.getpid()
+        return self._connection
+
+    def get(self, kind: str, key: str):
+        html = self._pending.get((kind, key))
+        if html is not None:
+            return html
+        row = self.connection.execute(
+            "SELECT html FROM fragments WHERE version = ? AND kind = ? AND key = ?",
+            (self.version, kind, key),
+        ).fetchone()
+        return row[0] if row else None
+
+    def put(self, kind: str, key: str, html: str):
+        self._pending[(kind, key)] = html
+        if len(self._pending) >= FLUSH_SIZE:
+            self.flush()
+
+    def flush(self):
+        if not self._pending:
+            return
+        connection = self.connection
+        with connection:
+            connection.execute("BEGIN IMMEDIATE")
+            connection.executemany(
+                "INSERT OR REPLACE INTO fragments (version, kind, key, html) VALUES (?, ?, ?, ?)",
+                [(self.version, kind, key, html) for (kind, key), html in self._pending.items()],
+            )
+        self._pending.clear()
+
+    def prune(self):
+        # Drop fragments rendered by other pipeline versions
+        self.flush()
+        cursor = self.connection.execute("DELETE FROM fragments WHERE version != ?", (self.version,))
+        return cursor.rowcount
+
+    def __len__(self):
+        self.flush()
+        row = self.connection.execute(
+            "SELECT COUNT(*) FROM fragments WHERE version = ?", (self.version,)
+        ).fetchone()
+        return row[0]
+
+    def close(self):
+        self.flush()
+        if self._connection is not None and self._pid == os.getpid():
+            self._connection.close()
+        self._connection = None
+        self._pid = None
+
+    def __repr__(self) -> str:
+        return f"RenderCache({self.path}, version={self.version[:12]})"
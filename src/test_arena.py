@@ -0,0 +1,83 @@
+import io
+import unittest
+from arena import NodeArena
+from htmlnode import HTMLNode, LeafNode, ParentNode
+from markdown_to_html_node import markdown_to_html_node
+
+
+MARKDOWN = """# Tïtle
+
+Some **bold** and _italic_ with a [link](https://example.com?a=1&b=2) and ![img](/a.png)
+
+- one
+- [link](https://example.com?a=1&b=2)
+
+> quote <here>
+
+```
+code & more
+```
+"""
+
+
+class TestNodeArena(unittest.TestCase):
+    def test_round_trip(self):
+        node = markdown_to_html_node(MARKDOWN)
+        arena = NodeArena.from_html_node(node)
+        self.assertEqual(arena.to_html_node(), node)
+
+    def test_render_matches_nodes(self):
+        node = markdown_to_html_node(MARKDOWN)
+        arena = NodeArena.from_html_node(node)
+        self.assertEqual(arena.to_html(), node.to_html())
+        stream = io.StringIO()
+        arena.write_html(stream)
+        self.assertEqual(stream.getvalue(), node.to_html())
+
+    def test_layout(self):
+        node = ParentNode("p", [LeafNode(None, "a "), LeafNode("b", "bold"), ParentNode("i", [LeafNode(None, "c")])])
+        arena = NodeArena.from_html_node(node)
+        self.assertEqual(len(arena), 5)
+        self.assertEqual(list(arena.parents), [-1, 0, 0, 0, 3])
+        self.assertEqual(arena.values, "a boldc")
+        self.assertEqual(arena.value(2), "bold")
+        self.assertEqual(arena.to_html(), "<p>a <b>bold</b><i>c</i></p>")
+
+    def test_shared_props(self):
+        node = markdown_to_html_node(MARKDOWN)
+        arena = NodeArena.from_html_node(node)
+        self.assertEqual(len(arena.props), 3)
+        self.assertEqual(list(arena.iter_props("href")), ["https://example.com?a=1&b=2"] * 2)
+
+    def test_single_leaf(self):
+        arena = NodeArena.from_html_node(LeafNode("b", "x"))
+        self.assertEqual(arena.to_html(), "<b>x</b>")
+        self.assertEqual(arena.to_html_node(), LeafNode("b", "x"))
+
+    def test_deep_tree(self):
+        node: HTMLNode = LeafNode("b", "deep")
+        for _ in range(5000):
+            node = ParentNode("span", [node])
+        self.assertEqual(NodeArena.from_html_node(node).to_html(), node.to_html())
+
+    def test_parent_without_children(self):
+        arena = NodeArena.from_html_node(ParentNode("div", [ParentNode("p", []), LeafNode(None, "x")]))
+        with self.assertRaises(ValueError):
+            arena.to_html()
+        stream = io.StringIO()
+        with self.assertRaises(ValueError):
+            arena.write_html(stream)
+        self.assertEqual(stream.getvalue(), "")
+
+    def test_parent_without_tag(self):
+        arena = NodeArena.from_html_node(ParentNode(None, [LeafNode(None, "x")]))  # type: ignore
+        with self.assertRaises(ValueError):
+            arena.to_html()
+
+    def test_unsupported_node(self):
+        with self.assertRaises(TypeError):
+            NodeArena.from_html_node(HTMLNode("p", "text"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+import asyncio
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+from asyncbuild import AsyncBuildReport, build_async
+from build import build
+from test_build import write_content
+
+
+class TestBuildAsync(unittest.TestCase):
+    def test_matches_build(self):
+        with TemporaryDirectory() as tmp:
+            content_dir = Path(tmp) / "content"
+            write_content(content_dir, 30)
+            build(content_dir, Path(tmp) / "sync", workers=1)
+            report = asyncio.run(build_async(content_dir, Path(tmp) / "async", workers=1, io_workers=3, queue_size=2))
+            self.assertEqual(len(report.built), 31)
+            for page in (Path(tmp) / "sync").rglob("*.html"):
+                self.assertEqual(page.read_text(), (Path(tmp) / "async" / page.relative_to(Path(tmp) / "sync")).read_text())
+
+    def test_process_pool(self):
+        with TemporaryDirectory() as tmp:
+            content_dir, public_dir = Path(tmp) / "content", Path(tmp) / "public"
+            write_content(content_dir, 12)
+            report = asyncio.run(build_async(content_dir, public_dir, workers=2, io_workers=2))
+            self.assertEqual(report.workers, 2)
+            self.assertIn("<p>Body of page 7</p>", (public_dir / "section1" / "page7.html").read_text())
+
+    def test_incremental(self):
+        with TemporaryDirectory() as tmp:
+            content_dir, public_dir = Path(tmp) / "content", Path(tmp) / "public"
+            write_content(content_dir, 4)
+            asyncio.run(build_async(content_dir, public_dir, workers=1))
+            (content_dir / "section0" / "page3.md").write_text("# Changed")
+            report = asyncio.run(build_async(content_dir, public_dir, workers=1))
+            self.assertEqual(report.built, [str(public_dir / "section0" / "page3.html")])
+            self.assertEqual(len(report.skipped), 4)
+
+    def test_sources_read_once(self):
+        with TemporaryDirectory() as tmp:
+            content_dir, public_dir = Path(tmp) / "content", Path(tmp) / "public"
+            write_content(content_dir, 6)
+            asyncio.run(build_async(content_dir, public_dir, workers=1))
+            (content_dir / "section0" / "page0.md").write_text("# Changed")
+            # Hashing happens on the bytes the pipeline read, never in a separate pass
+            with patch("build.hash_file", side_effect=AssertionError("source hashed separately")):
+                report = asyncio.run(build_async(content_dir, public_dir, workers=1))
+            self.assertEqual(report.built, [str(public_dir / "section0" / "page0.html")])
+            self.assertEqual(len(report.skipped), 6)
+            self.assertGreaterEqual(report.plan_seconds, 0.0)
+
+    def test_removed_page(self):
+        with TemporaryDirectory() as tmp:
+            content_dir, public_dir = Path(tmp) / "content", Path(tmp) / "public"
+            write_content(content_dir, 3)
+            asyncio.run(build_async(content_dir, public_dir, workers=1))
+            (content_dir / "section2" / "page2.md").unlink()
+            report = asyncio.run(build_async(content_dir, public_dir, workers=1))
+            self.assertEqual(report.removed, [str(public_dir / "section2" / "page2.html")])
+            self.assertEqual(build(content_dir, public_dir, workers=1).built, [])
+
+    def test_large_pages_are_mapped(self):
+        with TemporaryDirectory() as tmp:
+            content_dir = Path(tmp) / "content"
+            write_content(content_dir, 4)
+            (content_dir / "section0" / "page0.md").write_bytes(b"    # Indented\r\n\r\n    Body")
+            build(content_dir, Path(tmp) / "sync", workers=1)
+            with patch("build.MMAP_THRESHOLD", 0), patch("asyncbuild.timed_render", side_effect=AssertionError("read whole")):
+                report = asyncio.run(build_async(content_dir, Path(tmp) / "async", workers=1))
+            self.assertEqual(len(report.built), 5)
+            with patch("build.MMAP_THRESHOLD", 0):
+                build(content_dir, Path(tmp) / "mapped", workers=1)
+            for page in (Path(tmp) / "mapped").rglob("*.html"):
+                self.assertEqual(page.read_text(), (Path(tmp) / "async" / page.relative_to(Path(tmp) / "mapped")).read_text())
+
+    def test_crlf_sources(self):
+        with TemporaryDirectory() as tmp:
+            content_dir = Path(tmp) / "content"
+            content_dir.mkdir()
+            (content_dir / "page.md").write_bytes(b"# Title\r\n\r\nFirst para\r\n\r\n- a\r\n- b")
+            build(content_dir, Path(tmp) / "sync", workers=1)
+            asyncio.run(build_async(content_dir, Path(tmp) / "async", workers=1))
+            self.assertEqual((Path(tmp) / "async" / "page.html").read_text(), (Path(tmp) / "sync" / "page.html").read_text())
+
+    def test_render_cache(self):
+        with TemporaryDirectory() as tmp:
+            content_dir, public_dir = Path(tmp) / "content", Path(tmp) / "public"
+            write_content(content_dir, 4)
+            report = asyncio.run(build_async(content_dir, public_dir, workers=1, render_cache=Path(tmp) / "cache.db"))
+            self.assertEqual(len(report.built), 5)
+
+    def test_read_error_propagates(self):
+        with TemporaryDirectory() as tmp:
+            content_dir, public_dir = Path(tmp) / "content", Path(tmp) / "public"
+            write_content(content_dir, 6)
+            with patch("asyncbuild.read_source", side_effect=OSError("stale file handle")):
+                with self.assertRaisesRegex(OSError, "stale file handle"):
+                    asyncio.run(build_async(content_dir, public_dir, workers=1))
+
+    def test_overlap_efficiency(self):
+        report = AsyncBuildReport([], [], [], workers=2, wall_seconds=2.0, cpu_seconds=3.0, read_seconds=0.0, write_seconds=0.0)
+        self.assertEqual(report.overlap_efficiency, 0.75)
+        self.assertEqual(AsyncBuildReport([], [], [], 1, 0.0, 0.0, 0.0, 0.0).overlap_efficiency, 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from blockcache import BlockCache, block_key, entry_size
+from markdown_to_html_node import markdown_to_html, markdown_to_html_node
+
+
+class TestBlockCache(unittest.TestCase):
+    def test_get_or_render(self):
+        cache = BlockCache()
+        calls = []
+        def render(block):
+            calls.append(block)
+            return f"<p>{block}</p>"
+        self.assertEqual(cache.get_or_render("a", render), "<p>a</p>")
+        self.assertEqual(cache.get_or_render("a", render), "<p>a</p>")
+        self.assertEqual(calls, ["a"])
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        self.assertEqual(cache.hit_rate, 0.5)
+
+    def test_lru_entry_limit(self):
+        cache = BlockCache(max_entries=2)
+        cache.put("a", "A")
+        cache.put("b", "B")
+        cache.get("a")
+        cache.put("c", "C")
+        self.assertEqual(list(cache.entries), ["a", "c"])
+        self.assertEqual(cache.evictions, 1)
+
+    def test_memory_limit(self):
+        size = entry_size("a", "A")
+        cache = BlockCache(max_bytes=2 * size)
+        for key in "abc":
+            cache.put(key, key.upper())
+        self.assertEqual(list(cache.entries), ["b", "c"])
+        self.assertEqual(cache.nbytes, 2 * size)
+        cache.put("huge", "x" * 1000)
+        self.assertNotIn("huge", cache.entries)
+
+    def test_put_replaces(self):
+        cache = BlockCache()
+        cache.put("a", "A")
+        cache.put("a", "AA")
+        self.assertEqual(cache.nbytes, entry_size("a", "AA"))
+
+    def test_persistence(self):
+        with TemporaryDirectory() as tmp:
+            path = Path(tmp) / "blocks"
+            cache = BlockCache(path=path, version="1")
+            cache.put(block_key("block"), "<p>block</p>")
+            cache.save()
+            self.assertEqual(BlockCache(path=path, version="1").get(block_key("block")), "<p>block</p>")
+            self.assertEqual(len(BlockCache(path=path, version="2").entries), 0)
+
+    def test_no_path(self):
+        with self.assertRaises(ValueError):
+            BlockCache().save()
+
+
+class TestMarkdownToHTML(unittest.TestCase):
+    def test_matches_node_rendering(self):
+        md = "# Title\n\nSome **text**\nwrapped\n\n- a\n- b\n\n> quote\n\n```\ncode\n```"
+        self.assertEqual(markdown_to_html(md), markdown_to_html_node(md).to_html())
+
+    def test_cache_reuses_repeated_blocks(self):
+        cache = BlockCache()
+        md = "Shared **footer**\n\nPage one\n\nShared **footer**"
+        html = markdown_to_html(md, cache)
+        self.assertEqual(html, markdown_to_html_node(md).to_html())
+        self.assertEqual((cache.hits, cache.misses), (1, 2))
+
+    def test_empty_document(self):
+        self.assertEqual(markdown_to_html(""), "<div></div>")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,123 @@
+import unittest
+from unittest.mock import patch
+from pathlib import Path
+from tempfile import TemporaryDirectory
+import build as build_module
+from build import build, extract_title, render_page, find_pages, default_chunksize, pipeline_sources
+
+
+class TestExtractTitle(unittest.TestCase):
+    def test_extract_title(self):
+        self.assertEqual(extract_title("intro\n\n# Title  \n\n## Sub"), "Title")
+
+    def test_indented_title(self):
+        self.assertEqual(extract_title("    intro\n\n    # Title\n\n      # Deeper"), "Title")
+        self.assertIsNone(extract_title("  intro\n\n    # Deeper"))
+
+    def test_no_title(self):
+        self.assertIsNone(extract_title("## Sub\n\ntext"))
+
+
+class TestRenderPage(unittest.TestCase):
+    def test_render_page(self):
+        html = render_page("# Hello\n\nSome **text**")
+        self.assertIn("<title>Hello</title>", html)
+        self.assertIn("<div><h1>Hello</h1><p>Some <b>text</b></p></div>", html)
+
+    def test_indented_page_title(self):
+        html = render_page("    # Hello\n\n    Some text", "page")
+        self.assertIn("<title>Hello</title>", html)
+        self.assertIn("<div><h1>Hello</h1><p>Some text</p></div>", html)
+
+    def test_default_title(self):
+        html = render_page("text", "page")
+        self.assertIn("<title>page</title>", html)
+
+
+def write_content(content_dir: Path, nb_pages: int):
+    for i in range(nb_pages):
+        path = content_dir / f"section{i % 3}" / f"page{i}.md"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(f"# Page {i}\n\nBody of page {i}")
+    (content_dir / "index.md").write_text("# Home")
+
+
+class TestBuild(unittest.TestCase):
+    def test_build_single_worker(self):
+        with TemporaryDirectory() as tmp:
+            content_dir, public_dir = Path(tmp) / "content", Path(tmp) / "public"
+            write_content(content_dir, 5)
+            report = build(content_dir, public_dir, workers=1)
+            self.assertEqual(len(report.built), 6)
+            self.assertIn("<h1>Home</h1>", (public_dir / "index.html").read_text())
+            self.assertIn("Body of page 4", (public_dir / "section1" / "page4.html").read_text())
+
+    def test_build_process_pool(self):
+        with TemporaryDirectory() as tmp:
+            content_dir, public_dir = Path(tmp) / "content", Path(tmp) / "public"
+            write_content(content_dir, 20)
+            report = build(content_dir, public_dir, workers=2, chunksize=3)
+            self.assertEqual(len(report.built), 21)
+            self.assertEqual(report.built, [destination for _, destination in find_pages(content_dir, public_dir)])
+            self.assertIn("Body of page 13", (public_dir / "section1" / "page13.html").read_text())
+
+    def test_incremental_build(self):
+        with TemporaryDirectory() as tmp:
+            content_dir, public_dir = Path(tmp) / "content", Path(tmp) / "public"
+            write_content(content_dir, 5)
+            build(content_dir, public_dir, workers=1)
+            report = build(content_dir, public_dir, workers=1)
+            self.assertEqual((len(report.built), len(report.skipped), len(report.removed)), (0, 6, 0))
+
+            (content_dir / "section1" / "page1.md").write_text("# Changed")
+            (content_dir / "section2" / "page2.md").unlink()
+            (public_dir / "section0" / "page3.html").unlink()
+            report = build(content_dir, public_dir, workers=1)
+            self.assertEqual(sorted(report.built), [
+                str(public_dir / "section0" / "page3.html"),
+                str(public_dir / "section1" / "page1.html"),
+            ])
+            self.assertEqual(report.removed, [str(public_dir / "section2" / "page2.html")])
+            self.assertFalse((public_dir / "section2" / "page2.html").exists())
+            self.assertIn("<h1>Changed</h1>", (public_dir / "section1" / "page1.html").read_text())
+
+    def test_pipeline_change_rebuilds(self):
+        with TemporaryDirectory() as tmp:
+            content_dir, public_dir = Path(tmp) / "content", Path(tmp) / "public"
+            write_content(content_dir, 2)
+            build(content_dir, public_dir, workers=1)
+            with patch("build.pipeline_version", return_value="new version"):
+                report = build(content_dir, public_dir, workers=1)
+            self.assertEqual(len(report.built), 3)
+
+    def test_pipeline_sources_include_build(self):
+        self.assertIn(build_module.__file__, pipeline_sources())
+
+    def test_force_rebuilds(self):
+        with TemporaryDirectory() as tmp:
+            content_dir, public_dir = Path(tmp) / "content", Path(tmp) / "public"
+            write_content(content_dir, 2)
+            build(content_dir, public_dir, workers=1)
+            report = build(content_dir, public_dir, workers=1, force=True)
+            self.assertEqual(len(report.built), 3)
+
+    def test_parser_error_names_the_page(self):
+        with TemporaryDirectory() as tmp:
+            content_dir, public_dir = Path(tmp) / "content", Path(tmp) / "public"
+            write_content(content_dir, 4)
+            (content_dir / "section1" / "page1.md").write_text("use my_var here")
+            with self.assertRaisesRegex(ValueError, r"page1\.md: Unclosed delimiter '_'"):
+                build(content_dir, public_dir, workers=2, chunksize=1)
+
+    def test_missing_content_dir(self):
+        with TemporaryDirectory() as tmp:
+            with self.assertRaises(FileNotFoundError):
+                build(Path(tmp) / "missing", Path(tmp) / "public")
+
+    def test_default_chunksize(self):
+        self.assertEqual(default_chunksize(40_000, 8), 1250)
+        self.assertEqual(default_chunksize(3, 8), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
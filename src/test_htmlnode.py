@@ -1,5 +1,17 @@
 import unittest
-from htmlnode import HTMLNode, LeafNode, ParentNode, text_node_to_html_node
+from io import StringIO
+from unittest.mock import patch
+import htmlnode
+from htmlnode import (
+    HTMLNode,
+    LeafNode,
+    ParentNode,
+    text_node_to_html_node,
+    intern_props,
+    escape_text,
+    escape_attribute,
+    serialize_props,
+)
 from textnode import TextNode, TextType
 from enum import Enum
 
@@ -28,11 +40,22 @@ class TestHTMLNode(unittest.TestCase):
         expecteded = "HTMLNode(tag=p, value=Hello, children=[], props={'class': 'text'})"
         self.assertEqual(repr(node), expecteded)
 
+    def test_no_instance_dict(self):
+        nodes = [HTMLNode(), LeafNode("p", "text"), ParentNode("div", [LeafNode("p", "text")])]
+        for node in nodes:
+            with self.subTest(node=node):
+                self.assertFalse(hasattr(node, "__dict__"))
+
     def test_to_html_raises(self):
         node = HTMLNode()
         with self.assertRaises(NotImplementedError):
             node.to_html()
 
+    def test_write_html_raises(self):
+        node = HTMLNode()
+        with self.assertRaises(NotImplementedError):
+            node.write_html(StringIO())
+
 
 class TestLeafNode(unittest.TestCase):
     def test_to_html_p(self):
@@ -59,6 +82,33 @@ class TestLeafNode(unittest.TestCase):
             node.to_html()
     
 
+class TestEscaping(unittest.TestCase):
+    def test_escape_text(self):
+        self.assertEqual(escape_text("a < b && c > \"d\""), 'a &lt; b &amp;&amp; c &gt; "d"')
+
+    def test_escape_text_unchanged_is_same_object(self):
+        text = "nothing to escape here"
+        self.assertIs(escape_text(text), text)
+
+    def test_escape_attribute(self):
+        self.assertEqual(escape_attribute('x" onclick="y&z'), "x&quot; onclick=&quot;y&amp;z")
+
+    def test_leaf_value_escaped(self):
+        self.assertEqual(LeafNode("code", "<div>&</div>").to_html(), "<code>&lt;div&gt;&amp;&lt;/div&gt;</code>")
+        self.assertEqual(LeafNode(None, "1 < 2").to_html(), "1 &lt; 2")
+
+    def test_props_escaped(self):
+        node = text_node_to_html_node(TextNode('alt "text"', TextType.IMAGE, "img.png?a=1&b=2"))
+        self.assertEqual(node.to_html(), '<img src="img.png?a=1&amp;b=2" alt="alt &quot;text&quot;"></img>')
+
+    def test_serialized_props_cached(self):
+        first = serialize_props({"href": "https://cached.url"})
+        self.assertIs(serialize_props({"href": "https://cached.url"}), first)
+
+    def test_unhashable_props(self):
+        self.assertEqual(serialize_props({"class": ["a", "b"]}), ' class="[\'a\', \'b\']"')
+
+
 class TestParentNode(unittest.TestCase):
     def test_to_html_without_tag(self):
         child_node = LeafNode(None, "raw text")
@@ -106,6 +156,43 @@ class TestParentNode(unittest.TestCase):
             "<div><span><b>grandchild</b></span></div>",
         )
     
+    def test_iter_html_chunks(self):
+        parent_node = ParentNode("div", [LeafNode("b", "bold"), LeafNode(None, " text")])
+        self.assertEqual(list(parent_node.iter_html()), ["<div>", "<b>bold</b>", " text", "</div>"])
+
+    def test_write_html(self):
+        grandchild_node = LeafNode("a", "link", {"href": "url"})
+        parent_node = ParentNode("div", [ParentNode("p", [grandchild_node])])
+        stream = StringIO()
+        parent_node.write_html(stream)
+        self.assertEqual(stream.getvalue(), parent_node.to_html())
+        self.assertEqual(stream.getvalue(), '<div><p><a href="url">link</a></p></div>')
+
+    def test_to_html_deeply_nested(self):
+        depth = 50_000
+        node = LeafNode(None, "deep")
+        for _ in range(depth):
+            node = ParentNode("blockquote", [node])
+        self.assertEqual(node.to_html(), "<blockquote>" * depth + "deep" + "</blockquote>" * depth)
+
+    def test_invalid_grandchild(self):
+        parent_node = ParentNode("div", [ParentNode("p", [LeafNode(None, "ok"), "not a node"])])  # type: ignore
+        with self.assertRaises(TypeError):
+            parent_node.to_html()
+
+    def test_write_html_invalid_writes_nothing(self):
+        cases = [
+            (ParentNode("div", [LeafNode("b", "ok"), ParentNode("p", [LeafNode(None, "ok"), "not a node"])]), TypeError),  # type: ignore
+            (ParentNode("div", [LeafNode("b", "ok"), ParentNode("span", [])]), ValueError),
+            (ParentNode("div", [LeafNode("b", "ok"), LeafNode("i", None)]), ValueError),  # type: ignore
+        ]
+        for node, error in cases:
+            with self.subTest(node=node):
+                stream = StringIO()
+                with self.assertRaises(error):
+                    node.write_html(stream)
+                self.assertEqual(stream.getvalue(), "")
+
     def test_to_htl_without_grandchildren(self):
         child_node = ParentNode("span", [])
         parent_node = ParentNode("div", [child_node])
@@ -128,6 +215,26 @@ class TestTextNode_to_HTMLNode(unittest.TestCase):
                 html = text_node_to_html_node(node)
                 self.assertEqual((html.tag, html.value, html.children, html.props), expected)
 
+    def test_returns_leaf_nodes(self):
+        node = text_node_to_html_node(TextNode("link", TextType.LINK, "url"))
+        self.assertIsInstance(node, LeafNode)
+        self.assertEqual(node.to_html(), '<a href="url">link</a>')
+
+    def test_identical_props_are_shared(self):
+        first = text_node_to_html_node(TextNode("first", TextType.LINK, "https://shared.url"))
+        second = text_node_to_html_node(TextNode("second", TextType.LINK, "https://shared.url"))
+        other = text_node_to_html_node(TextNode("other", TextType.LINK, "https://other.url"))
+        self.assertIs(first.props, second.props)
+        self.assertIsNot(first.props, other.props)
+
+    def test_intern_props_limit(self):
+        with patch("htmlnode.PROPS_CACHE_LIMIT", 2):
+            intern_props(("id", "1"))
+            intern_props(("id", "2"))
+            props = intern_props(("id", "3"))
+            self.assertIs(intern_props(("id", "3")), props)
+            self.assertLessEqual(len(htmlnode._props_cache), 2)
+
     def test_unsupported_text_type(self):
         class FakeTextType(Enum):
             UNKNOWN = "unknown"
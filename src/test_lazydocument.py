@@ -0,0 +1,53 @@
+import unittest
+from io import StringIO
+from lazydocument import LazyDocument
+from markdown_to_html_node import markdown_to_html_node
+
+
+MARKDOWN = "# Title\n\nFirst **paragraph**\n\n- one\n- two\n\n```\ncode\n\nblock\n```\n\n> quote"
+
+
+class TestLazyDocument(unittest.TestCase):
+    def test_to_html_matches_eager(self):
+        self.assertEqual(LazyDocument(MARKDOWN).to_html(), markdown_to_html_node(MARKDOWN).to_html())
+
+    def test_write_html(self):
+        stream = StringIO()
+        LazyDocument(StringIO(MARKDOWN)).write_html(stream)
+        self.assertEqual(stream.getvalue(), markdown_to_html_node(MARKDOWN).to_html())
+
+    def test_excerpt_stops_early(self):
+        document = LazyDocument(MARKDOWN)
+        self.assertEqual(document.excerpt(2), "<div><h1>Title</h1><p>First <b>paragraph</b></p></div>")
+        self.assertEqual(document.blocks_parsed, 2)
+
+    def test_source_read_lazily(self):
+        def lines():
+            yield "# Title\n"
+            yield "\n"
+            yield "Summary\n"
+            yield "\n"
+            raise AssertionError("read past the excerpt")
+        self.assertEqual(LazyDocument(lines()).excerpt(2), "<div><h1>Title</h1><p>Summary</p></div>")
+
+    def test_iterates_again_from_cache(self):
+        document = LazyDocument(MARKDOWN)
+        first = document.head(1)
+        nodes = list(document)
+        self.assertIs(nodes[0], first[0])
+        self.assertEqual(len(nodes), 5)
+        self.assertEqual(list(document), nodes)
+
+    def test_uncached_single_pass(self):
+        document = LazyDocument(MARKDOWN, cache_nodes=False)
+        self.assertEqual(len(list(document)), 5)
+        self.assertEqual(document.blocks_parsed, 5)
+        with self.assertRaises(RuntimeError):
+            list(document)
+
+    def test_empty_excerpt(self):
+        self.assertEqual(LazyDocument("").excerpt(3), "")
+
+
+if __name__ == "__main__":
+    unittest.main()
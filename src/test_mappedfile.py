@@ -0,0 +1,136 @@
+import io
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from textwrap import dedent
+from unittest.mock import patch
+from build import build, render_page
+from mappedfile import extract_mapped_title, iter_mapped_blocks, mapped_markdown_to_html, open_mapped
+from markdown_to_html_node import markdown_to_html
+from textnode import markdown_to_blocks
+
+
+MARKDOWN = """# Tïtle
+
+Intro with **bold** and `code`
+
+
+- item one
+- item two
+
+```
+def f():
+
+    return "ü"
+```
+
+1. first
+2. second
+"""
+
+
+class TestIterMappedBlocks(unittest.TestCase):
+    def test_same_blocks_as_markdown_to_blocks(self):
+        self.assertEqual(list(iter_mapped_blocks(MARKDOWN.encode())), markdown_to_blocks(MARKDOWN))
+
+    def test_inline_fence(self):
+        markdown = "```x```\n\nnext\n\n```\nopen\n\nstill code\n```"
+        self.assertEqual(list(iter_mapped_blocks(markdown.encode())), markdown_to_blocks(markdown))
+
+    def test_release_pages(self):
+        with TemporaryDirectory() as tmp:
+            path = Path(tmp) / "big.md"
+            path.write_text("\n\n".join(f"paragraph {i}" for i in range(5000)))
+            with patch("mappedfile.RELEASE_BYTES", 4096), open_mapped(path) as buffer:
+                self.assertEqual(len(list(iter_mapped_blocks(buffer))), 5000)
+
+    def test_indented_blocks_are_dedented(self):
+        markdown = "    # Title\n\n    Some text\n  \t\n    - a\n    - b\n\n    ```\n    code\n      \n      more\n    ```\n"
+        self.assertEqual(list(iter_mapped_blocks(markdown.encode())), markdown_to_blocks(dedent(markdown)))
+
+    def test_extract_mapped_title(self):
+        self.assertEqual(extract_mapped_title(b"intro\n\n# T\xc3\xaftle  \n\n## Sub"), "Tïtle")
+        self.assertIsNone(extract_mapped_title(b"## Sub"))
+
+    def test_extract_indented_mapped_title(self):
+        self.assertEqual(extract_mapped_title(b"    intro\r\r      # Deeper\r    # Title\r"), "Title")
+        self.assertIsNone(extract_mapped_title(b"  intro\n\n    # Deeper"))
+
+
+class TestMappedMarkdownToHTML(unittest.TestCase):
+    def test_matches_markdown_to_html(self):
+        with TemporaryDirectory() as tmp:
+            path = Path(tmp) / "page.md"
+            path.write_text(MARKDOWN, encoding="utf-8")
+            stream = io.StringIO()
+            mapped_markdown_to_html(path, stream)
+            self.assertEqual(stream.getvalue(), markdown_to_html(MARKDOWN))
+
+    def test_process_pool(self):
+        with TemporaryDirectory() as tmp:
+            path = Path(tmp) / "page.md"
+            path.write_text(MARKDOWN * 20, encoding="utf-8")
+            stream = io.StringIO()
+            mapped_markdown_to_html(path, stream, workers=2)
+            self.assertEqual(stream.getvalue(), markdown_to_html(MARKDOWN * 20))
+
+    def test_crlf_matches_text_mode_read(self):
+        with TemporaryDirectory() as tmp:
+            path = Path(tmp) / "page.md"
+            path.write_bytes(MARKDOWN.replace("\n", "\r\n").encode("utf-8"))
+            with open(path, encoding="utf-8") as file:
+                expected = markdown_to_html(file.read())
+            stream = io.StringIO()
+            mapped_markdown_to_html(path, stream)
+            self.assertEqual(stream.getvalue(), expected)
+            with open_mapped(path) as buffer:
+                self.assertEqual(len(list(iter_mapped_blocks(buffer))), 5)
+                self.assertEqual(extract_mapped_title(buffer), "Tïtle")
+
+    def test_empty_file(self):
+        with TemporaryDirectory() as tmp:
+            path = Path(tmp) / "empty.md"
+            path.write_text("")
+            stream = io.StringIO()
+            mapped_markdown_to_html(path, stream)
+            self.assertEqual(stream.getvalue(), "<div></div>")
+
+    def test_build_maps_large_crlf_pages(self):
+        markdown = "# Title\r\n\r\nFirst para\r\n\r\n- a\r\n- b"
+        with TemporaryDirectory() as tmp:
+            content_dir = Path(tmp) / "content"
+            content_dir.mkdir()
+            (content_dir / "page.md").write_bytes(markdown.encode("utf-8"))
+            build(content_dir, Path(tmp) / "read", workers=1)
+            with patch("build.MMAP_THRESHOLD", 1):
+                build(content_dir, Path(tmp) / "mapped", workers=1)
+            mapped = (Path(tmp) / "mapped" / "page.html").read_text(encoding="utf-8")
+            self.assertEqual(mapped, (Path(tmp) / "read" / "page.html").read_text(encoding="utf-8"))
+            self.assertIn("<h1>Title</h1><p>First para</p><ul>", mapped)
+
+    def test_build_maps_large_indented_pages(self):
+        markdown = "    # Title\n\n    Some text\n\n    - a\n    - b\n"
+        with TemporaryDirectory() as tmp:
+            content_dir = Path(tmp) / "content"
+            content_dir.mkdir()
+            (content_dir / "page.md").write_text(markdown, encoding="utf-8")
+            build(content_dir, Path(tmp) / "read", workers=1)
+            with patch("build.MMAP_THRESHOLD", 0):
+                build(content_dir, Path(tmp) / "mapped", workers=1)
+            mapped = (Path(tmp) / "mapped" / "page.html").read_text(encoding="utf-8")
+            self.assertEqual(mapped, (Path(tmp) / "read" / "page.html").read_text(encoding="utf-8"))
+            self.assertIn("<ul><li>a</li><li>b</li></ul>", mapped)
+            self.assertIn("<title>Title</title>", mapped)
+
+    def test_build_maps_large_pages(self):
+        with TemporaryDirectory() as tmp:
+            content_dir, public_dir = Path(tmp) / "content", Path(tmp) / "public"
+            content_dir.mkdir()
+            (content_dir / "reference.md").write_text(MARKDOWN, encoding="utf-8")
+            with patch("build.MMAP_THRESHOLD", 0):
+                build(content_dir, public_dir, workers=1)
+            self.assertEqual((public_dir / "reference.html").read_text(encoding="utf-8"), render_page(MARKDOWN, "reference"))
+
+
+if __name__ == "__main__":
+    unittest.main()
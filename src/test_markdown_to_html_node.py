@@ -0,0 +1,59 @@
+import unittest
+from blockcache import BlockCache
+from markdown_to_html_node import markdown_to_html, markdown_to_html_node, markdown_to_html_many
+from markdown_to_html_node import iter_block_chunks, markdown_to_html_parallel
+
+
+class TestMarkdownToHTMLMany(unittest.TestCase):
+    DOCS = [f"# Doc {i}\n\nShared **disclaimer**\n\n- item {i}" for i in range(50)]
+
+    def expected(self):
+        return [markdown_to_html_node(doc).to_html() for doc in self.DOCS]
+
+    def test_serial_shares_cache(self):
+        cache = BlockCache()
+        self.assertEqual(markdown_to_html_many(self.DOCS, cache), self.expected())
+        self.assertEqual(cache.hits, 49)
+
+    def test_thread_pool(self):
+        cache = BlockCache()
+        self.assertEqual(markdown_to_html_many(self.DOCS, cache, executor="thread", workers=4), self.expected())
+        self.assertEqual(cache.hits + cache.misses, 150)
+
+    def test_process_pool(self):
+        self.assertEqual(markdown_to_html_many(self.DOCS, executor="process", workers=2, chunksize=8), self.expected())
+
+    def test_process_pool_without_cache(self):
+        self.assertEqual(markdown_to_html_many(self.DOCS, cache=None, executor="process", workers=2), self.expected())
+
+    def test_process_pool_rejects_own_cache(self):
+        with self.assertRaises(ValueError):
+            markdown_to_html_many(self.DOCS, BlockCache(), executor="process")
+
+    def test_without_cache(self):
+        self.assertEqual(markdown_to_html_many(iter(self.DOCS), cache=None), self.expected())
+
+    def test_unsupported_executor(self):
+        with self.assertRaises(ValueError):
+            markdown_to_html_many(self.DOCS, executor="fiber")  # type: ignore
+
+
+
+class TestMarkdownToHTMLParallel(unittest.TestCase):
+    MARKDOWN = "\n\n".join(f"## Entry {i}\n\n- fixed **bug** {i}\n- see [#{i}](https://example.com/{i})" for i in range(200))
+
+    def test_chunks_keep_order(self):
+        chunks = list(iter_block_chunks(["aa", "b", "cc", "d", "e"], 3))
+        self.assertEqual(chunks, [["aa", "b"], ["cc", "d"], ["e"]])
+
+    def test_serial(self):
+        self.assertEqual(markdown_to_html_parallel(self.MARKDOWN, workers=1, chunk_bytes=100), markdown_to_html(self.MARKDOWN))
+
+    def test_process_pool(self):
+        self.assertEqual(markdown_to_html_parallel(self.MARKDOWN, workers=2, chunk_bytes=500), markdown_to_html(self.MARKDOWN))
+
+    def test_empty(self):
+        self.assertEqual(markdown_to_html_parallel("", workers=2), "<div></div>")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+import unittest
+import patterns
+from patterns import (
+    PATTERNS,
+    RegexPattern,
+    register,
+    collect_stats,
+    pattern_stats,
+    format_stats,
+    LINK_PATTERN,
+)
+from textnode import text_to_textnodes, extract_markdown_links
+
+
+class TestRegexPattern(unittest.TestCase):
+    def test_untracked_methods_are_compiled_methods(self):
+        pattern = RegexPattern("test", r"a+")
+        self.assertEqual(pattern.search, pattern.regex.search)
+        self.assertEqual(pattern.findall, pattern.regex.findall)
+
+    def test_tracked_counts_hits_and_misses(self):
+        pattern = RegexPattern("test", r"a+")
+        pattern.track(True)
+        self.assertIsNotNone(pattern.search("baa"))
+        self.assertIsNone(pattern.match("baa"))
+        self.assertEqual(pattern.findall("aba"), ["a", "a"])
+        self.assertEqual(len(list(pattern.finditer("aba"))), 2)
+        self.assertEqual(pattern.calls, 4)
+        self.assertEqual(pattern.hits, 3)
+        self.assertEqual(pattern.misses, 1)
+        self.assertGreater(pattern.seconds, 0)
+
+    def test_reset(self):
+        pattern = RegexPattern("test", r"a+")
+        pattern.track(True)
+        pattern.search("a")
+        pattern.reset()
+        self.assertEqual((pattern.calls, pattern.hits, pattern.seconds), (0, 0, 0.0))
+
+
+class TestRegistry(unittest.TestCase):
+    def test_duplicate_name_raises(self):
+        with self.assertRaises(ValueError):
+            register("link", r"x")
+
+    def test_collect_stats(self):
+        with collect_stats():
+            text_to_textnodes("**bold** and [link](url)", engine="single_pass")
+            extract_markdown_links("no links here")
+        stats = pattern_stats()
+        self.assertEqual(stats["inline_token"]["calls"], 2)
+        self.assertEqual(stats["bold_close"]["hits"], 1)
+        self.assertEqual(stats["link"]["misses"], 1)
+        self.assertFalse(patterns._tracking)
+        self.assertEqual(LINK_PATTERN.search, LINK_PATTERN.regex.search)
+
+    def test_format_stats(self):
+        lines = format_stats().split("\n")
+        self.assertEqual(len(lines), len(PATTERNS) + 1)
+        self.assertTrue(lines[0].startswith("pattern"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+import json
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+import textnode
+import markdown_to_html_node as markdown_module
+from htmlnode import HTMLNode
+from profiling import Profiler
+from markdown_to_html_node import markdown_to_html_node
+from textnode import text_to_textnodes
+
+
+MARKDOWN = "# Title\n\nSome **bold** and [link](url)\n\n- one\n- two"
+
+
+class TestProfiler(unittest.TestCase):
+    def test_records_stages(self):
+        with Profiler() as profiler:
+            markdown_to_html_node(MARKDOWN).to_html()
+        stats = profiler.stats
+        self.assertEqual(stats["markdown_to_blocks"].calls, 1)
+        self.assertEqual(stats["classify_block"].calls, 3)
+        self.assertEqual(stats["split_nodes_image"].calls, 4)
+        self.assertEqual(stats["text_node_to_html_node"].calls, 7)
+        self.assertEqual(stats["to_html"].calls, 1)
+        self.assertGreater(stats["to_html"].seconds, 0)
+
+    def test_labels_delimiter_passes(self):
+        with Profiler() as profiler:
+            text_to_textnodes("**bold** _italic_", engine="pipeline")
+        for stage in ("split_nodes_delimiter[**]", "split_nodes_delimiter[_]", "split_nodes_delimiter[`]", "split_nodes_image", "split_nodes_link"):
+            with self.subTest(stage=stage):
+                self.assertEqual(profiler.stats[stage].calls, 1)
+
+    def test_disable_restores_functions(self):
+        originals = (textnode.markdown_to_blocks, markdown_module.markdown_to_blocks, HTMLNode.to_html)
+        with Profiler():
+            self.assertIsNot(textnode.markdown_to_blocks, originals[0])
+            self.assertIsNot(markdown_module.markdown_to_blocks, originals[1])
+        self.assertEqual((textnode.markdown_to_blocks, markdown_module.markdown_to_blocks, HTMLNode.to_html), originals)
+
+    def test_memory(self):
+        with Profiler(memory=True) as profiler:
+            markdown_to_html_node(MARKDOWN * 10)
+        self.assertGreater(profiler.stats["markdown_to_blocks"].bytes, 0)
+
+    def test_chrome_trace(self):
+        with Profiler(trace=True) as profiler:
+            markdown_to_html_node(MARKDOWN).to_html()
+        with TemporaryDirectory() as tmp:
+            path = Path(tmp) / "trace.json"
+            profiler.write_chrome_trace(path)
+            trace = json.loads(path.read_text())
+        events = trace["traceEvents"]
+        self.assertEqual(len(events), sum(stats.calls for stats in profiler.stats.values()))
+        self.assertEqual({event["ph"] for event in events}, {"X"})
+
+    def test_format_table(self):
+        with Profiler() as profiler:
+            markdown_to_html_node(MARKDOWN)
+        lines = profiler.format_table().split("\n")
+        self.assertEqual(len(lines), len(profiler.stats) + 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+from rendercache import RenderCache
+from blockcache import BlockCache
+from build import build
+
+
+def write_fragments(args: tuple[str, int]):
+    path, worker = args
+    cache = RenderCache(path, "v1")
+    for i in range(200):
+        cache.put("block", f"shared{i}", f"<p>{i}</p>")
+        cache.put("block", f"worker{worker}-{i}", f"<p>{worker}</p>")
+        cache.flush()
+        if cache.get("block", f"shared{i}") != f"<p>{i}</p>":
+            return False
+    return True
+
+
+class TestRenderCache(unittest.TestCase):
+    def test_get_put(self):
+        with TemporaryDirectory() as tmp:
+            cache = RenderCache(Path(tmp) / "cache.db", "v1")
+            self.assertIsNone(cache.get("block", "key"))
+            cache.put("block", "key", "<p>html</p>")
+            self.assertEqual(cache.get("block", "key"), "<p>html</p>")
+            self.assertIsNone(cache.get("page", "key"))
+            cache.close()
+
+    def test_version_isolation_and_prune(self):
+        with TemporaryDirectory() as tmp:
+            path = Path(tmp) / "cache.db"
+            old = RenderCache(path, "v1")
+            old.put("page", "key", "old")
+            old.flush()
+            new = RenderCache(path, "v2")
+            self.assertIsNone(new.get("page", "key"))
+            self.assertEqual(new.prune(), 1)
+            self.assertEqual(len(old), 0)
+            old.close()
+            new.close()
+
+    def test_writes_are_batched(self):
+        with TemporaryDirectory() as tmp:
+            path = Path(tmp) / "cache.db"
+            cache, other = RenderCache(path, "v1"), RenderCache(path, "v1")
+            cache.put("block", "key", "<p>html</p>")
+            self.assertEqual(cache.get("block", "key"), "<p>html</p>")
+            self.assertIsNone(other.get("block", "key"))
+            cache.flush()
+            self.assertEqual(other.get("block", "key"), "<p>html</p>")
+            with patch("rendercache.FLUSH_SIZE", 3):
+                for i in range(3):
+                    cache.put("block", f"chunk{i}", "<p>chunk</p>")
+            self.assertEqual(other.get("block", "chunk2"), "<p>chunk</p>")
+            cache.put("page", "key", "<html>")
+            cache.close()
+            self.assertEqual(other.get("page", "key"), "<html>")
+            other.close()
+
+    def test_concurrent_workers(self):
+        with TemporaryDirectory() as tmp:
+            path = str(Path(tmp) / "cache.db")
+            with ProcessPoolExecutor(max_workers=4) as executor:
+                results = list(executor.map(write_fragments, [(path, worker) for worker in range(4)]))
+            self.assertEqual(results, [True] * 4)
+            cache = RenderCache(path, "v1")
+            self.assertEqual(len(cache), 200 + 4 * 200)
+            cache.close()
+
+    def test_block_cache_backend(self):
+        with TemporaryDirectory() as tmp:
+            backend = RenderCache(Path(tmp) / "cache.db", "v1")
+            calls = []
+            def render(block):
+                calls.append(block)
+                return block.upper()
+            BlockCache(backend=backend).get_or_render("block", render)
+            other = BlockCache(backend=backend)
+            self.assertEqual(other.get_or_render("block", render), "BLOCK")
+            self.assertEqual((calls, other.backend_hits), (["block"], 1))
+            backend.close()
+
+
+class TestBuildWithRenderCache(unittest.TestCase):
+    def test_build_shares_cache(self):
+        with TemporaryDirectory() as tmp:
+            content_dir, public_dir = Path(tmp) / "content", Path(tmp) / "public"
+            content_dir.mkdir()
+            for i in range(6):
+                (content_dir / f"page{i}.md").write_text(f"# Cached page {i}\n\nShared **cached** footer")
+            cache_path = Path(tmp) / "cache.db"
+            build(content_dir, public_dir, workers=2, chunksize=1, render_cache=cache_path)
+            first = (public_dir / "page3.html").read_text()
+            report = build(content_dir, public_dir, workers=1, force=True, render_cache=cache_path)
+            self.assertEqual(len(report.built), 6)
+            self.assertEqual((public_dir / "page3.html").read_text(), first)
+            cache = RenderCache(cache_path, "")
+            count = cache.connection.execute("SELECT kind, COUNT(*) FROM fragments GROUP BY kind").fetchall()
+            self.assertEqual(dict(count), {"block": 7, "page": 6})
+            cache.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
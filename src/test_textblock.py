@@ -1,6 +1,7 @@
 import unittest
-from textblock import BlockType, block_to_block_type, block_to_html_node
+from textblock import BlockType, BLOCK_HANDLERS, block_to_block_type, block_to_html_node, classify_block
 from htmlnode import ParentNode, LeafNode
+from markdown_to_html_node import markdown_to_html_node
 
 
 class TestBlockToBlockType(unittest.TestCase):
@@ -133,6 +134,27 @@ class TestBlockToBlockType(unittest.TestCase):
                 self.assertNotEqual(result, BlockType.ORDERED_LIST)
                 self.assertEqual(result, BlockType.PARAGRAPH)
 
+    def test_ordered_list_needs_dot(self):
+        self.assertEqual(block_to_block_type("1x First\n2x Second"), BlockType.PARAGRAPH)
+
+    def test_ordered_list_leading_zeros(self):
+        self.assertEqual(block_to_block_type("01. a\n02. b"), BlockType.ORDERED_LIST)
+        self.assertEqual(block_to_block_type("01. a\n03. b"), BlockType.PARAGRAPH)
+        node = block_to_html_node("01. a\n02. b", BlockType.ORDERED_LIST)
+        self.assertEqual(node.to_html(), "<ol><li>a</li><li>b</li></ol>")
+
+    def test_classify_block_returns_lines(self):
+        cases = [
+            ("# Title", BlockType.HEADING, ["# Title"]),
+            ("> a\n> b", BlockType.QUOTE, ["> a", "> b"]),
+            ("- a\n- b", BlockType.UNORDERED_LIST, ["- a", "- b"]),
+            ("1. a\n2. b", BlockType.ORDERED_LIST, ["1. a", "2. b"]),
+            ("- a\nb", BlockType.PARAGRAPH, ["- a", "b"]),
+        ]
+        for block, expected_type, expected_lines in cases:
+            with self.subTest(block=block):
+                self.assertEqual(classify_block(block), (expected_type, expected_lines))
+
     def test_block_to_paragraph(self):
         cases = [
             "This is a paragraph.",
@@ -177,6 +199,46 @@ class TestBlockToHTMLNode(unittest.TestCase):
             html,
             "<div><pre><code>This is text that _should_ remain\nthe **same** even with inline stuff\n</code></pre></div>",
         )
+
+    def test_headings(self):
+        md = "# Title\n\n### Sub **bold**\n\n###### Six"
+        node = markdown_to_html_node(md)
+        self.assertEqual(
+            node.to_html(),
+            "<div><h1>Title</h1><h3>Sub <b>bold</b></h3><h6>Six</h6></div>",
+        )
+
+    def test_quote(self):
+        md = "> first _line_\n>second line"
+        node = markdown_to_html_node(md)
+        self.assertEqual(
+            node.to_html(),
+            "<div><blockquote>first <i>line</i>\nsecond line</blockquote></div>",
+        )
+
+    def test_lists(self):
+        md = "- item **one**\n- item two\n\n1. first\n2. [second](url)"
+        node = markdown_to_html_node(md)
+        self.assertEqual(
+            node.to_html(),
+            "<div><ul><li>item <b>one</b></li><li>item two</li></ul>"
+            '<ol><li>first</li><li><a href="url">second</a></li></ol></div>',
+        )
+
+    def test_inline_codeblock(self):
+        node = block_to_html_node("```print('hi')```", BlockType.CODE)
+        self.assertEqual(node.to_html(), "<pre><code>print('hi')</code></pre>")
+
+    def test_codeblock_with_blank_lines(self):
+        md = "```\nfirst\n\nsecond\n```"
+        node = markdown_to_html_node(md)
+        self.assertEqual(node.to_html(), "<div><pre><code>first\n\nsecond\n</code></pre></div>")
+
+    def test_every_block_type_has_handler(self):
+        for block_type in BlockType:
+            with self.subTest(block_type=block_type):
+                self.assertIn(block_type, BLOCK_HANDLERS)
+
     def test_paragraph_to_html_node(self):
         pass
         cases = [
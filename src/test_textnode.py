@@ -9,7 +9,10 @@ from textnode import (
     split_nodes_link,
     text_to_textnodes,
     markdown_to_blocks,
+    iter_blocks,
 )
+from io import StringIO
+from time import perf_counter
 
 
 class TestTexNode(unittest.TestCase):
@@ -42,6 +45,10 @@ class TestTexNode(unittest.TestCase):
         node = TextNode("Example", TextType.CODE)
         self.assertEqual(repr(node), "TextNode(Example, code, None)")
 
+    def test_no_instance_dict(self):
+        node = TextNode("text", TextType.TEXT)
+        self.assertFalse(hasattr(node, "__dict__"))
+
     def test_repr_with_url(self):
         node = TextNode("Example", TextType.LINK, url="http://example.com")
         self.assertEqual(repr(node), "TextNode(Example, link, http://example.com)")
@@ -355,6 +362,24 @@ class TestSplitNodesWithURL(unittest.TestCase):
                 split = split_nodes_link([TextNode(text, TextType.TEXT)])
                 self.assertEqual(split, expected)
 
+    def test_split_repeated_links(self):
+        split = split_nodes_link([TextNode("[same](url) and [same](url) and [same](url)!", TextType.TEXT)])
+        expected = [
+            TextNode("same", TextType.LINK, "url"),
+            TextNode(" and ", TextType.TEXT),
+            TextNode("same", TextType.LINK, "url"),
+            TextNode(" and ", TextType.TEXT),
+            TextNode("same", TextType.LINK, "url"),
+            TextNode("!", TextType.TEXT),
+        ]
+        self.assertEqual(split, expected)
+
+    def test_split_many_links(self):
+        text = "x [link](url)" * 5000
+        split = split_nodes_link([TextNode(text, TextType.TEXT)])
+        self.assertEqual(len(split), 10000)
+        self.assertEqual(split[-1], TextNode("link", TextType.LINK, "url"))
+
     def test_malformed_syntax(self):
         cases = [
             ("![missing paren", [TextNode("![missing paren", TextType.TEXT)]),
@@ -419,6 +444,59 @@ class TestTextToTextNodes(unittest.TestCase):
                 nodes = text_to_textnodes(text)
                 self.assertEqual(nodes, expected)
 
+    def test_engines_match(self):
+        texts = [
+            "",
+            "plain text",
+            "**bold**_italic_`code`",
+            "a****b",
+            "***a***",
+            "**bold with _underscore_ and [link](url)**",
+            "_italic with `backtick` and ![img](src)_",
+            "[link](url) then ![img](src) then [link](url)",
+            "[a ![b](c)](d)",
+            "[x](y![z)",
+            "![]()[]()",
+            "[text](url\n)",
+            "x [a ![b](c) d](e) [f](g)",
+            "[a](b ![c](d) [e](f)",
+            "[a] (" + "![b](c " * 5,
+        ]
+        for text in texts:
+            with self.subTest(text=text):
+                self.assertEqual(
+                    text_to_textnodes(text, engine="single_pass"),
+                    text_to_textnodes(text, engine="pipeline"),
+                )
+
+    def test_engines_raise_on_unclosed(self):
+        texts = [
+            "**unclosed",
+            "_unclosed",
+            "`unclosed",
+            "_a **b** c_",
+            "`a_b`",
+            "[link](https://a_b.com)",
+        ]
+        for text in texts:
+            for engine in ("single_pass", "pipeline"):
+                with self.subTest(text=text, engine=engine):
+                    with self.assertRaises(ValueError):
+                        text_to_textnodes(text, engine=engine)  # type: ignore
+
+    def test_single_pass_unclosed_images(self):
+        # Stray "![" used to backtrack over the rest of the line at every "!"
+        for text in ("[a](" + "![b](" * 100, "[a] (" + "![b](c " * 40):
+            with self.subTest(text=text[:12]):
+                start = perf_counter()
+                nodes = text_to_textnodes(text, engine="single_pass")
+                self.assertLess(perf_counter() - start, 2)
+                self.assertEqual(nodes, [TextNode(text, TextType.TEXT)])
+
+    def test_unsupported_engine(self):
+        with self.assertRaises(ValueError):
+            text_to_textnodes("text", engine="unknown")  # type: ignore
+
 
 class TestMarkdownToBlocs(unittest.TestCase):
     def test_markdown_to_blocks(self):
@@ -460,6 +538,26 @@ This is the same paragraph on a new line
             with self.subTest(md=md):
                 blocks = markdown_to_blocks(md)
                 self.assertEqual(blocks, expected)
+                self.assertEqual(list(iter_blocks(StringIO(md))), expected)
+
+    def test_fenced_code_with_blank_lines(self):
+        md = "Paragraph\n\n```\ncode\n\n\nmore code\n```\n\n```inline```\n\nLast paragraph\n"
+        expected = [
+            "Paragraph",
+            "```\ncode\n\n\nmore code\n```",
+            "```inline```",
+            "Last paragraph",
+        ]
+        self.assertEqual(markdown_to_blocks(md), expected)
+        self.assertEqual(list(iter_blocks(StringIO(md))), expected)
+
+    def test_iter_blocks_is_lazy(self):
+        def lines():
+            yield "first block\n"
+            yield "\n"
+            raise AssertionError("read past the first block")
+        blocks = iter_blocks(lines())
+        self.assertEqual(next(blocks), "first block")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,207 @@
+import threading
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from urllib.request import urlopen
+from build import build, update_pages, load_manifest, MANIFEST_NAME
+from watch import snapshot, diff_snapshots, watch, start_server
+
+
+class TestSnapshot(unittest.TestCase):
+    def test_diff_snapshots(self):
+        old = {"a.md": (1, 10), "b.md": (1, 10), "c.md": (1, 10)}
+        new = {"a.md": (1, 10), "b.md": (2, 10), "d.md": (1, 5)}
+        self.assertEqual(diff_snapshots(old, new), ({"b.md", "d.md"}, {"c.md"}))
+
+    def test_snapshot_only_markdown(self):
+        with TemporaryDirectory() as tmp:
+            (Path(tmp) / "page.md").write_text("# Page")
+            (Path(tmp) / "image.png").write_bytes(b"")
+            self.assertEqual(list(snapshot(Path(tmp))), [str(Path(tmp) / "page.md")])
+
+
+class TestUpdatePages(unittest.TestCase):
+    def test_update_pages(self):
+        with TemporaryDirectory() as tmp:
+            content_dir, public_dir = Path(tmp) / "content", Path(tmp) / "public"
+            content_dir.mkdir()
+            (content_dir / "keep.md").write_text("# Keep")
+            (content_dir / "edit.md").write_text("# Edit")
+            (content_dir / "gone.md").write_text("# Gone")
+            build(content_dir, public_dir, workers=1)
+            (content_dir / "edit.md").write_text("# Edited")
+            (content_dir / "gone.md").unlink()
+            report = update_pages(
+                content_dir,
+                public_dir,
+                [str(content_dir / "edit.md")],
+                [str(content_dir / "gone.md")],
+            )
+            self.assertEqual(report.built, [str(public_dir / "edit.html")])
+            self.assertEqual(report.removed, [str(public_dir / "gone.html")])
+            self.assertIn("<h1>Edited</h1>", (public_dir / "edit.html").read_text())
+            self.assertEqual(sorted(load_manifest(public_dir / MANIFEST_NAME)), ["edit.md", "keep.md"])
+            self.assertEqual(len(build(content_dir, public_dir, workers=1).built), 0)
+
+    def test_failing_page_does_not_block_others(self):
+        with TemporaryDirectory() as tmp:
+            content_dir, public_dir = Path(tmp) / "content", Path(tmp) / "public"
+            content_dir.mkdir()
+            (content_dir / "a.md").write_text("# A")
+            (content_dir / "z.md").write_text("# Z")
+            (content_dir / "gone.md").write_text("# Gone")
+            build(content_dir, public_dir, workers=1)
+            old_manifest = load_manifest(public_dir / MANIFEST_NAME)
+            (content_dir / "a.md").write_text("half typed **bold")
+            (content_dir / "z.md").write_text("# Z, edited")
+            (content_dir / "gone.md").unlink()
+            report = update_pages(
+                content_dir,
+                public_dir,
+                [str(content_dir / "a.md"), str(content_dir / "z.md")],
+                [str(content_dir / "gone.md")],
+            )
+            self.assertEqual(report.built, [str(public_dir / "z.html")])
+            self.assertEqual(report.removed, [str(public_dir / "gone.html")])
+            self.assertEqual(list(report.errors), [str(content_dir / "a.md")])
+            self.assertIn("a.md", str(report.errors[str(content_dir / "a.md")]))
+            self.assertIn("<h1>Z, edited</h1>", (public_dir / "z.html").read_text())
+            manifest = load_manifest(public_dir / MANIFEST_NAME)
+            self.assertEqual(sorted(manifest), ["a.md", "z.md"])
+            self.assertEqual(manifest["a.md"], old_manifest["a.md"])
+            self.assertNotEqual(manifest["z.md"], old_manifest["z.md"])
+
+
+class TestWatch(unittest.TestCase):
+    def test_watch_rebuilds_changed_pages(self):
+        with TemporaryDirectory() as tmp:
+            content_dir, public_dir = Path(tmp) / "content", Path(tmp) / "public"
+            content_dir.mkdir()
+            (content_dir / "page.md").write_text("# First")
+            stop = threading.Event()
+            rebuilds = []
+            def on_rebuild(report, latency):
+                rebuilds.append((report, latency))
+                stop.set()
+            thread = threading.Thread(
+                target=watch,
+                args=(content_dir, public_dir),
+                kwargs={"interval": 0.01, "debounce": 0.05, "on_rebuild": on_rebuild, "stop": stop},
+            )
+            thread.start()
+            while not (public_dir / "page.html").exists():
+                stop.wait(0.01)
+            (content_dir / "page.md").write_text("# Second, a longer title")
+            (content_dir / "new.md").write_text("# New")
+            thread.join(timeout=5)
+            stop.set()
+            self.assertEqual(len(rebuilds), 1)
+            report, latency = rebuilds[0]
+            self.assertEqual(sorted(report.built), [str(public_dir / "new.html"), str(public_dir / "page.html")])
+            self.assertIsNotNone(latency)
+            self.assertIn("<h1>Second, a longer title</h1>", (public_dir / "page.html").read_text())
+
+    def test_watch_survives_conversion_errors(self):
+        with TemporaryDirectory() as tmp:
+            content_dir, public_dir = Path(tmp) / "content", Path(tmp) / "public"
+            content_dir.mkdir()
+            (content_dir / "page.md").write_text("# First")
+            stop = threading.Event()
+            errors = []
+            rebuilds = []
+            def on_rebuild(report, latency):
+                rebuilds.append(report)
+                stop.set()
+            thread = threading.Thread(
+                target=watch,
+                args=(content_dir, public_dir),
+                kwargs={
+                    "interval": 0.01,
+                    "debounce": 0.05,
+                    "on_rebuild": on_rebuild,
+                    "on_error": errors.append,
+                    "stop": stop,
+                },
+            )
+            thread.start()
+            while not (public_dir / "page.html").exists():
+                stop.wait(0.01)
+            (content_dir / "page.md").write_text("half typed **bold")
+            while not errors:
+                stop.wait(0.01)
+            self.assertTrue(thread.is_alive())
+            self.assertIn("page.md", str(errors[0]))
+            (content_dir / "page.md").write_text("half typed **bold**, done")
+            thread.join(timeout=5)
+            stop.set()
+            self.assertEqual(len(errors), 1)
+            self.assertEqual([report.built for report in rebuilds], [[str(public_dir / "page.html")]])
+            self.assertIn("<b>bold</b>, done", (public_dir / "page.html").read_text())
+
+    def test_watch_starts_with_a_broken_page(self):
+        with TemporaryDirectory() as tmp:
+            content_dir, public_dir = Path(tmp) / "content", Path(tmp) / "public"
+            content_dir.mkdir()
+            (content_dir / "page.md").write_text("use my_var here")
+            stop = threading.Event()
+            errors = []
+            thread = threading.Thread(
+                target=watch,
+                args=(content_dir, public_dir),
+                kwargs={"interval": 0.01, "debounce": 0.05, "on_rebuild": lambda *_: stop.set(), "on_error": errors.append, "stop": stop},
+            )
+            thread.start()
+            while not errors:
+                stop.wait(0.01)
+            (content_dir / "page.md").write_text("use `my var` here")
+            thread.join(timeout=5)
+            stop.set()
+            self.assertEqual(len(errors), 1)
+            self.assertIn("<code>my var</code>", (public_dir / "page.html").read_text())
+
+    def test_watch_rebuilds_around_a_broken_page(self):
+        with TemporaryDirectory() as tmp:
+            content_dir, public_dir = Path(tmp) / "content", Path(tmp) / "public"
+            content_dir.mkdir()
+            (content_dir / "a.md").write_text("half typed **bold")
+            (content_dir / "z.md").write_text("# First")
+            stop = threading.Event()
+            errors = []
+            rebuilds = []
+            def on_rebuild(report, latency):
+                rebuilds.append(report.built)
+                if len(rebuilds) == 2:
+                    stop.set()
+            thread = threading.Thread(
+                target=watch,
+                args=(content_dir, public_dir),
+                kwargs={"interval": 0.01, "debounce": 0.05, "on_rebuild": on_rebuild, "on_error": errors.append, "stop": stop},
+            )
+            thread.start()
+            while not rebuilds:
+                stop.wait(0.01)
+            (content_dir / "z.md").write_text("# Second")
+            thread.join(timeout=5)
+            stop.set()
+            self.assertEqual(rebuilds, [[str(public_dir / "z.html")], [str(public_dir / "z.html")]])
+            self.assertEqual(len(errors), 1)
+            self.assertIn("a.md", str(errors[0]))
+            self.assertIn("<h1>Second</h1>", (public_dir / "z.html").read_text())
+            self.assertFalse((public_dir / "a.html").exists())
+
+
+class TestServer(unittest.TestCase):
+    def test_serves_public_dir(self):
+        with TemporaryDirectory() as tmp:
+            (Path(tmp) / "index.html").write_text("<h1>Home</h1>")
+            server = start_server(tmp, port=0)
+            try:
+                with urlopen(f"http://localhost:{server.server_address[1]}/index.html") as response:
+                    self.assertEqual(response.read(), b"<h1>Home</h1>")
+            finally:
+                server.shutdown()
+                server.server_close()
+
+
+if __name__ == "__main__":
+    unittest.main()
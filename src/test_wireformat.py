@@ -0,0 +1,67 @@
+import pickle
+import unittest
+from htmlnode import HTMLNode, LeafNode, ParentNode
+from textnode import TextNode, TextType, text_to_textnodes
+from markdown_to_html_node import markdown_to_html_node
+from wireformat import dumps, loads
+
+
+MARKDOWN = """# Tïtle
+
+Some **bold** and _italic_ with a [link](https://example.com) and ![img](/a.png)
+
+- one
+- [link](https://example.com)
+
+```
+code < here
+```
+"""
+
+
+class TestWireFormat(unittest.TestCase):
+    def test_html_tree_round_trip(self):
+        node = markdown_to_html_node(MARKDOWN)
+        decoded = loads(dumps(node))
+        self.assertEqual(decoded, node)
+        self.assertIsInstance(decoded.children[0], ParentNode)
+        self.assertEqual(decoded.to_html(), node.to_html())
+
+    def test_text_nodes_round_trip(self):
+        nodes = text_to_textnodes("A **b** `c` [d](https://e) ![f](g)")
+        self.assertEqual(loads(dumps(nodes)), nodes)
+
+    def test_single_leaf(self):
+        leaf = LeafNode(None, "text")
+        self.assertEqual(loads(dumps(leaf)), leaf)
+        self.assertIsInstance(loads(dumps(leaf)), LeafNode)
+
+    def test_empty_values_and_list(self):
+        nodes = [TextNode("", TextType.TEXT), LeafNode("a", "", {"href": ""})]
+        self.assertEqual(loads(dumps(nodes)), nodes)
+        self.assertEqual(loads(dumps([])), [])
+
+    def test_shared_strings_and_props(self):
+        children: list[HTMLNode] = [LeafNode("a", "same", {"href": "https://example.com"}) for _ in range(100)]
+        node = ParentNode("p", children)
+        self.assertLess(len(dumps(node)), len(pickle.dumps(node, pickle.HIGHEST_PROTOCOL)) / 2)
+        decoded = loads(dumps(node))
+        self.assertIs(decoded.children[0].props, decoded.children[1].props)
+
+    def test_deep_tree(self):
+        node: HTMLNode = LeafNode("b", "deep")
+        for _ in range(5000):
+            node = ParentNode("span", [node])
+        self.assertEqual(loads(dumps(node)).to_html(), node.to_html())
+
+    def test_unsupported_node(self):
+        with self.assertRaises(TypeError):
+            dumps(HTMLNode("p", "text"))
+
+    def test_bad_magic(self):
+        with self.assertRaises(ValueError):
+            loads(b"NOPE\x00\x00\x00\x00")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,6 @@
-import re
 from enum import Enum
-from htmlnode import HTMLNode, ParentNode, LeafNode, text_node_to_html_node
+from patterns import HEADING_PATTERN
+from htmlnode import ParentNode, LeafNode, text_node_to_html_node
 from textnode import text_to_textnodes
 
 
@@ -13,61 +13,114 @@ class BlockType(Enum):
     ORDERED_LIST = "ordered_list"
 
 
-def block_to_block_type(block: str):
-    match = re.match(r"(?P<pounds>#*) ", block)
-    if match:
-        nb_pounds = len(match.group("pounds"))
-        if nb_pounds > 0 and nb_pounds < 7:
-            return BlockType.HEADING
-    if block.startswith("```") and block.endswith("```"):
-        return BlockType.CODE
+def classify_block(block: str):
+    # Each line is checked once, against the only block type its first line allows
     lines = block.split("\n")
-    if all(line.startswith(">") for line in lines):
-        return BlockType.QUOTE
-    if all(line.startswith("- ") for line in lines):
-        return BlockType.UNORDERED_LIST
-    is_ordered = True
-    prev_num = 0
+    if block.startswith("#"):
+        match = HEADING_PATTERN.match(block)
+        if match and len(match.group("pounds")) < 7:
+            return BlockType.HEADING, lines
+    if block.startswith("```") and block.endswith("```"):
+        return BlockType.CODE, lines
+    first_char = block[:1]
+    if first_char == ">":
+        for line in lines:
+            if not line.startswith(">"):
+                return BlockType.PARAGRAPH, lines
+        return BlockType.QUOTE, lines
+    if first_char == "-":
+        for line in lines:
+            if not line.startswith("- "):
+                return BlockType.PARAGRAPH, lines
+        return BlockType.UNORDERED_LIST, lines
+    if first_char.isdigit():
+        for num, line in enumerate(lines, 1):
+            if ordered_item_start(line, num) < 0:
+                return BlockType.PARAGRAPH, lines
+        return BlockType.ORDERED_LIST, lines
+    return BlockType.PARAGRAPH, lines
+
+
+def ordered_item_start(line: str, num: int):
+    # Where the text of item num starts, -1 if the line is not that item
+    prefix = f"{num}. "
+    if line.startswith(prefix):
+        return len(prefix)
+    # Numbers are compared as int() reads them, so "01. " is item 1
+    dot = line.find(". ")
+    if dot > 0 and line[:dot].isdecimal() and int(line[:dot]) == num:
+        return dot + 2
+    return -1
+
+
+def block_to_block_type(block: str):
+    block_type, _ = classify_block(block)
+    return block_type
+
+
+HEADING_TAGS = ("h1", "h2", "h3", "h4", "h5", "h6")
+
+
+def text_to_children(text: str):
+    return [text_node_to_html_node(text_node) for text_node in text_to_textnodes(text)]
+
+
+def paragraph_to_html_node(block: str, lines: list[str]):
+    return ParentNode("p", text_to_children(block))
+
+
+def heading_to_html_node(block: str, lines: list[str]):
+    nb_pounds = block.find(" ")
+    if not 0 < nb_pounds < 7 or block[:nb_pounds].strip("#"):
+        raise ValueError(f"Invalid heading block: {block}")
+    return ParentNode(HEADING_TAGS[nb_pounds - 1], text_to_children(block[nb_pounds + 1:]))
+
+
+def code_to_html_node(block: str, lines: list[str]):
+    if len(lines) == 1: # ```code```
+        text = block[3:-3]
+    else: # the opening fence line is dropped
+        text = block[len(lines[0]) + 1:-3]
+    return ParentNode("pre", [LeafNode("code", text)])
+
+
+def quote_to_html_node(block: str, lines: list[str]):
+    quote_lines = []
     for line in lines:
-        match = re.match(r"(?P<num>\d+). ", line)
-        if not match:
-            is_ordered = False
-            break
-        num = int(match.group("num"))
-        if prev_num + 1 != num:
-            is_ordered = False
-            break
-        prev_num = num
-    if is_ordered:
-        return BlockType.ORDERED_LIST
-    return BlockType.PARAGRAPH
-
-
-def block_to_html_node(block: str, block_type: BlockType):
-    match block_type:
-        case BlockType.PARAGRAPH:
-            html_children = []
-            text_nodes = text_to_textnodes(block)
-            for text_node in text_nodes:
-                html_node = text_node_to_html_node(text_node)
-                leaf_node = LeafNode(html_node.tag, html_node.value, html_node.props)
-                html_children.append(leaf_node)
-            parent_node = ParentNode("div", html_children)
-            return parent_node
-        case BlockType.HEADING:
-            html_children = []
-            text_nodes = text_to_textnodes(block)
-            for text_node in text_nodes:
-                html_node = text_node_to_html_node(text_node)
-                leaf_node = LeafNode(html_node.tag, html_node.value, html_node.props)
-                html_children.append(leaf_node)
-            parent_node = ParentNode("div", html_children)
-        # case BlockType.CODE:
-        #     pass
-        # case BlockType.QUOTE:
-        #     pass
-        # case BlockType.UNORDERED_LIST:
-        #     pass
-        # case BlockType.ORDERED_LIST:
-        #     pass
-    # return html_nodes
\ No newline at end of file
+        line = line[1:]
+        quote_lines.append(line[1:] if line.startswith(" ") else line)
+    return ParentNode("blockquote", text_to_children("\n".join(quote_lines)))
+
+
+def unordered_list_to_html_node(block: str, lines: list[str]):
+    items = [ParentNode("li", text_to_children(line[2:])) for line in lines]
+    return ParentNode("ul", items)
+
+
+def ordered_list_to_html_node(block: str, lines: list[str]):
+    items = []
+    for num, line in enumerate(lines, 1):
+        start = ordered_item_start(line, num)
+        if start < 0:
+            raise ValueError(f"Invalid ordered list item: {line}")
+        items.append(ParentNode("li", text_to_children(line[start:])))
+    return ParentNode("ol", items)
+
+
+BLOCK_HANDLERS = {
+    BlockType.PARAGRAPH: paragraph_to_html_node,
+    BlockType.HEADING: heading_to_html_node,
+    BlockType.CODE: code_to_html_node,
+    BlockType.QUOTE: quote_to_html_node,
+    BlockType.UNORDERED_LIST: unordered_list_to_html_node,
+    BlockType.ORDERED_LIST: ordered_list_to_html_node,
+}
+
+
+def block_to_html_node(block: str, block_type: BlockType, lines: list[str] | None = None):
+    handler = BLOCK_HANDLERS.get(block_type)
+    if handler is None:
+        raise ValueError(f"Unsupported block type {block_type}")
+    if lines is None:
+        lines = block.split("\n")
+    return handler(block, lines)
@@ -1,5 +1,14 @@
 from enum import Enum
-from typing import Literal, Any
+from typing import Literal, Any, Iterable
+from patterns import (
+    IMAGE_PATTERN,
+    LINK_PATTERN,
+    INLINE_TOKEN_PATTERN,
+    INLINE_IMAGE_PATTERN,
+    BOLD_CLOSE_PATTERN,
+    ITALIC_CLOSE_PATTERN,
+    CODE_CLOSE_PATTERN,
+)
 
 class TextType(Enum):
     TEXT = "text"
@@ -11,6 +20,8 @@ class TextType(Enum):
 
 
 class TextNode():
+    __slots__ = ("text", "text_type", "url")
+
     def __init__(
             self, 
             text: str, 
@@ -57,14 +68,12 @@ def split_nodes_delimiter(old_nodes: list[TextNode], delimiter: str, text_type:
 
 
 def extract_markdown_images(text: str):
-    from re import findall
-    matches = findall(r"!\[(?P<text>.*?)\]\((?P<url>.*?)\)", text) # ![<text>](<url>)
+    matches = IMAGE_PATTERN.findall(text)
     return matches
 
 
 def extract_markdown_links(text: str):
-    from re import findall
-    matches = findall(r"\[(?P<text>.*?)\]\((?P<url>.*?)\)", text) # [<text>](<url>)
+    matches = LINK_PATTERN.findall(text)
     return matches
 
 
@@ -72,33 +81,26 @@ def split_nodes_with_url(old_nodes: list[TextNode], strategy_type: Literal["imag
     if strategy_type not in ["image", "link"]:
         raise ValueError(f"Unsupported split node strategy '{strategy_type}'")
     new_node_type = TextType.LINK if strategy_type == "link" else TextType.IMAGE
+    pattern = LINK_PATTERN if strategy_type == "link" else IMAGE_PATTERN
     new_nodes: list[TextNode] = []
     for node in old_nodes:
         if node.text_type != TextType.TEXT:
             new_nodes.append(node)
             continue
-        if strategy_type == "link":
-            matches = extract_markdown_links(node.text)
-        else:
-            matches = extract_markdown_images(node.text)
-        if not matches:
+        text = node.text
+        pos = 0
+        matched = False
+        for match in pattern.finditer(text):
+            start, end = match.span()
+            if start > pos:
+                new_nodes.append(TextNode(text[pos:start], TextType.TEXT))
+            new_nodes.append(TextNode(match.group("text"), new_node_type, match.group("url")))
+            pos = end
+            matched = True
+        if not matched:
             new_nodes.append(node)
-            continue
-        text_left = node.text
-        for match in matches:
-            match_text = match[0]
-            match_url = match[1]
-            if strategy_type == "link":
-                sep = f"[{match_text}]({match_url})"
-            else:
-                sep = f"![{match_text}]({match_url})"
-            parts = text_left.split(sep, 1)
-            if parts[0] != "":
-                new_nodes.append(TextNode(parts[0], TextType.TEXT))
-            text_left = parts[1]
-            new_nodes.append(TextNode(match_text, new_node_type, match_url))
-        if text_left:
-            new_nodes.append(TextNode(text_left, TextType.TEXT))
+        elif pos < len(text):
+            new_nodes.append(TextNode(text[pos:], TextType.TEXT))
     return new_nodes
 
 
@@ -112,7 +114,63 @@ def split_nodes_link(old_nodes: list[TextNode]):
     return new_nodes
 
 
-def text_to_textnodes(text: str):
+DELIMITER_CLOSE_PATTERNS = {
+    "**": (TextType.BOLD, BOLD_CLOSE_PATTERN),
+    "_": (TextType.ITALIC, ITALIC_CLOSE_PATTERN),
+    "`": (TextType.CODE, CODE_CLOSE_PATTERN),
+}
+
+
+def tokenize_inline(text: str):
+    if not text:
+        return [TextNode(text, TextType.TEXT)]
+    new_nodes: list[TextNode] = []
+    append = new_nodes.append
+    search = INLINE_TOKEN_PATTERN.search
+    pos = 0
+    end = len(text)
+    # Tokens are searched before limit, the start of an image that a link gave way to
+    limit = end
+    while pos < end:
+        match = search(text, pos, limit)
+        if not match:
+            if limit > pos:
+                append(TextNode(text[pos:limit], TextType.TEXT))
+            pos, limit = limit, end
+            continue
+        start, match_end = match.span()
+        kind = match.lastgroup
+        if kind == "href" and text.find("![", start, match_end) != -1:
+            # The pipeline extracts images first: a link cannot close over one
+            image = INLINE_IMAGE_PATTERN.search(text, start)
+            if image and image.start() < match_end:
+                limit = image.start()
+                continue
+        if start > pos:
+            append(TextNode(text[pos:start], TextType.TEXT))
+        if kind == "delimiter":
+            delimiter = match.group(kind)
+            text_type, close_pattern = DELIMITER_CLOSE_PATTERNS[delimiter]
+            close = close_pattern.search(text, match_end)
+            if not close or close.group() != delimiter:
+                raise ValueError(f"Unclosed delimiter '{delimiter}' in: {text}")
+            close_start, pos = close.span()
+            if close_start > match_end:
+                append(TextNode(text[match_end:close_start], text_type))
+        elif kind == "src":
+            append(TextNode(match.group("alt"), TextType.IMAGE, match.group(kind)))
+            pos = match_end
+        else:
+            append(TextNode(match.group("text"), TextType.LINK, match.group(kind)))
+            pos = match_end
+    return new_nodes
+
+
+def text_to_textnodes(text: str, engine: Literal["single_pass", "pipeline"] = "pipeline"):
+    if engine == "single_pass":
+        return tokenize_inline(text)
+    if engine != "pipeline":
+        raise ValueError(f"Unsupported inline engine '{engine}'")
     text_nodes = [TextNode(text, TextType.TEXT)]
     text_nodes = split_nodes_delimiter(text_nodes, "**", TextType.BOLD)
     text_nodes = split_nodes_delimiter(text_nodes, "_", TextType.ITALIC)
@@ -122,8 +180,32 @@ def text_to_textnodes(text: str):
     return text_nodes
 
 
+def iter_blocks(fileobj: Iterable[str]):
+    lines: list[str] = []
+    in_fence = False
+    for line in fileobj:
+        line = line.rstrip("\n")
+        stripped = line.strip()
+        if stripped.startswith("```"):
+            # A line like ```code``` opens and closes its own fence
+            if in_fence or len(stripped) < 6 or not stripped.endswith("```"):
+                in_fence = not in_fence
+        if line or in_fence:
+            lines.append(line)
+            continue
+        block = "\n".join(lines).strip()
+        lines.clear()
+        if block:
+            yield block
+    block = "\n".join(lines).strip()
+    if block:
+        yield block
+
+
 def markdown_to_blocks(markdown: str):
+    if "```" in markdown:
+        return list(iter_blocks(markdown.split("\n")))
     blocks = markdown.split("\n\n")
     blocks = [block.strip() for block in blocks]
     blocks = [block for block in blocks if block]
-    return blocks
\ No newline at end of file
+    return blocks
@@ -0,0 +1,111 @@
+import os
+import sys
+import threading
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from time import monotonic, time
+from typing import Callable
+from build import BuildReport, build, update_pages
+
+
+def snapshot(content_dir: Path):
+    files: dict[str, tuple[int, int]] = {}
+    for path in content_dir.rglob("*.md"):
+        try:
+            stat = path.stat()
+        except FileNotFoundError: # deleted while scanning
+            continue
+        files[str(path)] = (stat.st_mtime_ns, stat.st_size)
+    return files
+
+
+def diff_snapshots(old: dict[str, tuple[int, int]], new: dict[str, tuple[int, int]]):
+    changed = {path for path, stat in new.items() if old.get(path) != stat}
+    removed = set(old) - set(new)
+    return changed, removed
+
+
+def save_latency(changed: set[str]):
+    # Time from the newest source save to its HTML being on disk
+    mtimes = []
+    for path in changed:
+        try:
+            mtimes.append(os.stat(path).st_mtime)
+        except FileNotFoundError:
+            continue
+    if not mtimes:
+        return None
+    return time() - max(mtimes)
+
+
+def print_rebuild(report: BuildReport, latency: float | None):
+    message = f"Rebuilt {len(report.built)} pages, removed {len(report.removed)}"
+    if latency is not None:
+        message += f" (save to HTML on disk: {latency * 1e3:.0f} ms)"
+    print(message, flush=True)
+
+
+def print_error(error: Exception):
+    # Conversion errors already name the page, see build.convert_page
+    print(f"Rebuild failed: {error}", file=sys.stderr, flush=True)
+
+
+def watch(
+        content_dir: str | Path,
+        public_dir: str | Path,
+        interval: float = 0.2,
+        debounce: float = 0.3,
+        on_rebuild: Callable[[BuildReport, float | None], None] = print_rebuild,
+        stop: threading.Event | None = None,
+        on_error: Callable[[Exception], None] = print_error,
+        ):
+    content_dir, public_dir = Path(content_dir), Path(public_dir)
+    stop = stop or threading.Event()
+    previous = snapshot(content_dir)
+    pending_changed: set[str] = set()
+    pending_removed: set[str] = set()
+    # Pending pages whose last conversion failed: retried once their source changes again, not on every poll
+    failed: set[str] = set()
+    try:
+        build(content_dir, public_dir)
+    except (ValueError, OSError):
+        # update_pages converts every page on its own, builds the valid ones and reports the others
+        pending_changed = set(previous)
+    last_change = 0.0
+    while not stop.wait(interval):
+        current = snapshot(content_dir)
+        changed, removed = diff_snapshots(previous, current)
+        previous = current
+        if changed or removed:
+            # Wait for the burst of changes to settle before rebuilding
+            pending_changed = (pending_changed | changed) - removed
+            pending_removed = (pending_removed | removed) - changed
+            failed -= changed | removed
+            last_change = monotonic()
+            continue
+        retry = pending_changed - failed
+        if not (retry or pending_removed) or monotonic() - last_change < debounce:
+            continue
+        try:
+            report = update_pages(content_dir, public_dir, sorted(retry), sorted(pending_removed))
+        except (ValueError, OSError) as error:
+            # The manifest could not be read or written: every page stays pending
+            on_error(error)
+            failed |= retry
+            continue
+        for error in report.errors.values():
+            # A page being edited is often invalid for a moment: it stays pending
+            on_error(error)
+        failed |= set(report.errors)
+        if report.built or report.removed:
+            on_rebuild(report, save_latency(retry - failed))
+        pending_changed, pending_removed = set(failed), set()
+
+
+def start_server(public_dir: str | Path, host: str = "localhost", port: int = 8888):
+    handler = partial(SimpleHTTPRequestHandler, directory=str(public_dir))
+    server = ThreadingHTTPServer((host, port), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server
@@ -0,0 +1,140 @@
+import struct
+import sys
+from array import array
+from htmlnode import HTMLNode, LeafNode, ParentNode
+from textnode import TextNode, TextType
+
+
+# Layout: header, then one little-endian uint32 array, then every string of the tree in one UTF-8 blob.
+# The array holds the string lengths, the props table and the nodes in pre-order:
+#   OP_TEXT text_type text url | OP_LEAF tag value props | OP_PARENT tag props nb_children
+# Strings and props are indexes into their tables, index 0 standing for None.
+MAGIC = b"MDW\x01"
+HEADER = struct.Struct("<4sI")
+OP_TEXT = 0
+OP_LEAF = 1
+OP_PARENT = 2
+TEXT_TYPES = list(TextType)
+TEXT_TYPE_CODES = {text_type: code for code, text_type in enumerate(TEXT_TYPES)}
+
+Node = TextNode | HTMLNode
+
+
+class Encoder():
+    def __init__(self) -> None:
+        self.strings: dict[str, int] = {}
+        self.props: dict[tuple, int] = {}
+        self.props_codes = array("I")
+        self.ops = array("I")
+
+    def string(self, value: str | None):
+        if value is None:
+            return 0
+        index = self.strings.get(value)
+        if index is None:
+            index = self.strings[value] = len(self.strings) + 1
+        return index
+
+    def props_ref(self, props: dict | None):
+        if not props:
+            return 0
+        items = tuple(props.items())
+        index = self.props.get(items)
+        if index is None:
+            index = self.props[items] = len(self.props) + 1
+            self.props_codes.append(len(items))
+            for key, value in items:
+                self.props_codes.append(self.string(key))
+                self.props_codes.append(self.string(value))
+        return index
+
+    def node(self, node: Node, stack: list[Node]):
+        ops = self.ops
+        if isinstance(node, TextNode):
+            ops.extend((OP_TEXT, TEXT_TYPE_CODES[node.text_type], self.string(node.text), self.string(node.url)))
+        elif isinstance(node, LeafNode):
+            ops.extend((OP_LEAF, self.string(node.tag), self.string(node.value), self.props_ref(node.props)))
+        elif isinstance(node, ParentNode):
+            children = node.children or []
+            ops.extend((OP_PARENT, self.string(node.tag), self.props_ref(node.props), len(children)))
+            stack.extend(reversed(children))
+        else:
+            raise TypeError(f"Cannot serialize {type(node).__name__}")
+
+    def encode(self, roots: list[Node], is_list: bool):
+        # Explicit stack, as in ParentNode.iter_html, so deep trees do not hit the recursion limit
+        stack = list(reversed(roots))
+        while stack:
+            self.node(stack.pop(), stack)
+        lengths = array("I", [len(string) for string in self.strings])
+        codes = array("I", (int(is_list), len(roots), len(lengths)))
+        codes.extend(lengths)
+        codes.append(len(self.props))
+        codes.extend(self.props_codes)
+        codes.extend(self.ops)
+        blob = "".join(self.strings).encode("utf-8")
+        if sys.byteorder == "big":
+            codes.byteswap()
+        return HEADER.pack(MAGIC, len(codes)) + codes.tobytes() + blob
+
+
+def dumps(obj: Node | list[Node]):
+    if isinstance(obj, list):
+        return Encoder().encode(obj, True)
+    return Encoder().encode([obj], False)
+
+
+def loads(data: bytes):
+    magic, nb_codes = HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError("Not a serialized node tree")
+    codes_end = HEADER.size + nb_codes * 4
+    codes = array("I")
+    codes.frombytes(data[HEADER.size:codes_end])
+    if sys.byteorder == "big":
+        codes.byteswap()
+    text = data[codes_end:].decode("utf-8")
+    is_list, nb_roots, nb_strings = codes[0], codes[1], codes[2]
+    position = 3
+    strings: list[str | None] = [None]
+    offset = 0
+    for length in codes[position:position + nb_strings]:
+        strings.append(text[offset:offset + length])
+        offset += length
+    position += nb_strings
+    nb_props = codes[position]
+    position += 1
+    props_table: list[dict | None] = [None]
+    for _ in range(nb_props):
+        nb_items = codes[position]
+        items = codes[position + 1:position + 1 + 2 * nb_items]
+        props_table.append({strings[items[i]]: strings[items[i + 1]] for i in range(0, len(items), 2)})
+        position += 1 + 2 * nb_items
+    roots: list[Node] = []
+    targets = [roots]
+    remaining = [nb_roots] if nb_roots else []
+    target = roots
+    ops = iter(codes[position:].tolist())
+    for op in ops:
+        first, second, third = next(ops), next(ops), next(ops)
+        remaining[-1] -= 1
+        if op == OP_TEXT:
+            target.append(TextNode(strings[second], TEXT_TYPES[first], strings[third]))
+        elif op == OP_LEAF:
+            target.append(LeafNode(strings[first], strings[second], props_table[third]))
+        elif op == OP_PARENT:
+            children = []
+            target.append(ParentNode(strings[first], children, props_table[second]))
+            if third:
+                # The next nodes are this parent's children
+                targets.append(children)
+                remaining.append(third)
+                target = children
+                continue
+        else:
+            raise ValueError(f"Unknown opcode {op}")
+        while remaining and not remaining[-1]:
+            targets.pop()
+            remaining.pop()
+            target = targets[-1] if targets else roots
+    return roots if is_list else roots[0]